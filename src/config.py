@@ -1,8 +1,10 @@
 """Configuration management for BCL Parser."""
 import os
+import re
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from urllib.parse import urlsplit
+from typing import Dict, Optional, Tuple
 
 # Social network domains (for detection)
 SOCIAL_NETWORK_DOMAINS = [
@@ -93,6 +95,31 @@ DOMAIN_TO_SOCIAL_NETWORK = {
     'soundcloud.com': 'soundcloud',
 }
 
+# All social network domains as one alternation (longest first), so a link is scanned
+# once instead of once per domain; stdlib re is enough here (only the parser's per-entry
+# patterns use the optional google-re2).
+# Matched against the lowercased link, so no IGNORECASE (per-character case folding) is needed
+_SOCIAL_DOMAIN_RE = re.compile(
+    '|'.join(re.escape(domain) for domain in sorted(DOMAIN_TO_SOCIAL_NETWORK, key=len, reverse=True))
+)
+
+
+def _match_social_domain(link: str) -> Optional[str]:
+    """Return the known social domain a link belongs to, or None."""
+    # Common case: the host (or its parent, e.g. m.facebook.com) is a known domain - one dict lookup
+    try:
+        host = (urlsplit(link).hostname or '').removeprefix('www.')
+    except ValueError:
+        host = ''
+    if host in DOMAIN_TO_SOCIAL_NETWORK:
+        return host
+    parent = host.partition('.')[2]
+    if parent in DOMAIN_TO_SOCIAL_NETWORK:
+        return parent
+    # Fallback: the domain appears elsewhere in the link (or the link has no scheme)
+    match = _SOCIAL_DOMAIN_RE.search(link.lower())
+    return match.group(0) if match else None
+
 # Base column mappings (year-agnostic templates)
 SOCIAL_NETWORK_COLUMNS = {
     'Місяць': 'A',     # Column A
@@ -284,8 +311,7 @@ def detect_table_from_link(link: str, entry_date=None) -> str:
         year = date.today().year
     
     # Check if link is from a social network
-    link_lower = link.lower()
-    is_social_network = any(domain in link_lower for domain in SOCIAL_NETWORK_DOMAINS)
+    is_social_network = _match_social_domain(link) is not None
     
     # Return appropriate table name based on category
     if is_social_network:
@@ -318,9 +344,7 @@ def detect_table_from_entry(entry) -> str:
     
     # Fallback: check link domain
     if entry.link:
-        link_lower = entry.link.lower()
-        is_social_network = any(domain in link_lower for domain in SOCIAL_NETWORK_DOMAINS)
-        if is_social_network:
+        if _match_social_domain(entry.link):
             return TABLE_NAME_PATTERNS['social_network'].format(YEAR=year)
     
     # Default: media table
@@ -329,9 +353,31 @@ def detect_table_from_entry(entry) -> str:
 
 def detect_social_network_from_link(link: str) -> str:
     """Detect social network name from link (for dropdown)."""
-    link_lower = link.lower()
-    for domain, network_name in DOMAIN_TO_SOCIAL_NETWORK.items():
-        if domain in link_lower:
-            return network_name
+    domain = _match_social_domain(link)
+    if domain:
+        return DOMAIN_TO_SOCIAL_NETWORK[domain]
     return ''  # Empty if not a recognized social network
 
+
+def detect_social_network_and_table(link: str, entry_date=None) -> Tuple[str, str]:
+    """
+    Detect social network name and table name from a link with a single domain lookup.
+    
+    Same results as detect_social_network_from_link() and detect_table_from_link(),
+    without scanning the link twice.
+    
+    Args:
+        link: The post URL
+        entry_date: Optional date object to determine year. If None, uses current year.
+    
+    Returns:
+        Tuple of (social network dropdown option or '', table name with year)
+    """
+    from datetime import date
+    
+    year = entry_date.year if entry_date else date.today().year
+    domain = _match_social_domain(link)
+    if domain:
+        return DOMAIN_TO_SOCIAL_NETWORK[domain], TABLE_NAME_PATTERNS['social_network'].format(YEAR=year)
+    return '', TABLE_NAME_PATTERNS['media'].format(YEAR=year)
+
@@ -13,9 +13,9 @@ class ParsedDate:
     parsed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedEntry:
-    """Represents a parsed data entry."""
+    """Represents a parsed data entry (slotted: one is created per parsed row)."""
     name: str = ''              # Назва
     social_network: str = ''    # Соцмережа
     tag: str = ''               # Тема (first tag or empty)
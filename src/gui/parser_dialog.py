@@ -4,7 +4,7 @@ import logging
 from collections import defaultdict
 from datetime import date, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
@@ -16,13 +16,16 @@ from PyQt6.QtCore import QThread, pyqtSignal, Qt
 from PyQt6.QtGui import QFont
 
 from ..database.models import ParsedEntry
-from ..parser.youscan_parser import YouScanParser
 from ..sheets.google_sheets import GoogleSheetsWriter
 from ..config import Config
 from ..database.db_manager import DatabaseManager
 from ..utils.date_tracker import DateTracker
 from ..export.excel_exporter import export_entries_to_xlsx
 
+if TYPE_CHECKING:
+    # Imported where the parser is created: Playwright is only loaded once parsing starts
+    from ..parser.youscan_parser import YouScanParser
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -98,7 +101,7 @@ class ParsingThread(QThread):
     
     def __init__(
         self, 
-        parser: YouScanParser,
+        parser: 'YouScanParser',
         dates: List[date],
         table_name: str
     ):
@@ -112,15 +115,8 @@ class ParsingThread(QThread):
     
     def run(self):
         """Run parsing in thread."""
-        # Create new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            # Run async parsing
-            loop.run_until_complete(self._run_async())
-        finally:
-            loop.close()
+        # asyncio.run creates (and closes) a fresh event loop for this thread
+        asyncio.run(self._run_async())
     
     async def _run_async(self):
         """Async parsing logic."""
@@ -222,7 +218,7 @@ class ParserDialog(QDialog):
         
         self.entries: List[ParsedEntry] = []
         self.errors: List[Dict] = []
-        self.parser: Optional[YouScanParser] = None
+        self.parser: Optional['YouScanParser'] = None
         self.parsing_thread: Optional[ParsingThread] = None
         self.table_checkboxes: Dict[str, QCheckBox] = {}  # {table_name: checkbox}
         
@@ -714,6 +710,7 @@ class ParserDialog(QDialog):
         # Initialize parser - will be started in thread with async
         try:
             logger.info("Initializing YouScan parser")
+            from ..parser.youscan_parser import YouScanParser
             # Use persistent context to save cookies/session (helps avoid detection)
             self.parser = YouScanParser(email, password, headless=False, use_persistent_context=True)
             logger.info("Parser initialized (will start browser in thread)")
@@ -175,8 +175,6 @@ class SettingsDialog(QDialog):
         except Exception as e:
             logger.exception("Error saving settings")
             print(f"[ERROR] Error saving settings: {str(e)}")
-            import traceback
-            traceback.print_exc()
             QMessageBox.critical(
                 self,
                 "Error",
@@ -40,8 +40,6 @@ def main():
         print(f"\n{'='*60}")
         print(f"FATAL ERROR: {e}")
         print(f"{'='*60}")
-        import traceback
-        traceback.print_exc()
         sys.exit(1)
 
 
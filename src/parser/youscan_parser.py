@@ -1,12 +1,151 @@
 """YouScan.io parser for BCL Parser."""
+import logging
+import os
 import re
-import time
+import sys
 import asyncio
-from datetime import date, datetime
-from typing import List, Optional, Dict
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, List, Optional, Dict
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Locator, Error as PlaywrightError
 from ..database.models import ParsedEntry
-from ..config import detect_table_from_link, detect_table_from_entry, detect_social_network_from_link, SOCIAL_NETWORK_OPTIONS, TAG_OPTIONS
+from ..config import detect_table_from_entry, detect_social_network_from_link, detect_social_network_and_table, SOCIAL_NETWORK_DOMAINS, TAG_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+# uvloop (optional, not available on Windows) has a cheaper scheduler and socket polling
+# than the default loop, which speeds up the CDP traffic behind every Playwright call.
+# Set once per process; the parser thread's asyncio.run() picks the policy up.
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Errors expected from a single DOM probe (missing/detached element, timeout).
+# Anything else - notably asyncio.CancelledError - must propagate.
+_PLAYWRIGHT_ERRORS = (PlaywrightError, asyncio.TimeoutError, AttributeError)
+
+# Playwright error messages meaning the page re-rendered under us and the entry
+# handles went stale; re-discovering the entries is enough to recover
+_STALE_HANDLE_MESSAGES = (
+    'object has been collected',
+    'not attached to the dom',
+    'execution context was destroyed',
+    'page crashed',
+)
+
+# Note cleanup in one pass: trailing "Перекласти" (translate) button text and
+# engagement numbers like "1 тис."
+_NOTE_CLEAN_RE = re.compile(r'Перекласти\s*$|\d+\s*тис\.')
+
+# Ukrainian/Russian month names (genitive, as in "2 січня 2026 р.") to month numbers
+_MONTH_MAP = MappingProxyType({
+    'січня': 1, 'лютого': 2, 'березня': 3, 'квітня': 4, 'травня': 5, 'червня': 6,
+    'липня': 7, 'серпня': 8, 'вересня': 9, 'жовтня': 10, 'листопада': 11, 'грудня': 12,
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4, 'мая': 5, 'июня': 6,
+    'июля': 7, 'августа': 8, 'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12,
+})
+
+# Per-entry patterns, compiled once at import instead of looked up in re's cache per call.
+# google-re2 (optional) matches them in linear time; its search()/group() API is the same,
+# and the flags are written inline so both engines accept the patterns. re2's \s is ASCII-only,
+# so the no-break space innerText yields for &nbsp; is spelled out to match under both engines
+try:
+    import re2 as _entry_re
+except ImportError:
+    _entry_re = re
+# The date pattern only matches known month names, so the _MONTH_MAP lookup cannot miss
+_ENTRY_DATE_RE = _entry_re.compile(
+    r'(?i)(\d{1,2})[\s\xa0]+(' + '|'.join(map(re.escape, _MONTH_MAP)) + r')[\s\xa0]+(\d{4})'
+)  # "2 січня 2026 р."
+_NAME_ACTION_RE = _entry_re.compile(r'^([А-ЯІЇЄҐа-яіїєґ\s\xa0]+?)[\s\xa0]+(відповіла|відповів|залишив|поділив)')
+_ENGAGEMENT_RE = re.compile(r'\d+\s*тис\.')  # Engagement numbers like "1 тис."
+
+# Date range query parameters in the mentions URL
+_FROM_RE = re.compile(r'from=(\d{4}-\d{2}-\d{2})')
+_TO_RE = re.compile(r'to=(\d{4}-\d{2}-\d{2})')
+
+# Pages only reachable with a session: themes, dashboard or the app root
+# (anchored, so /login?returnUrl=/themes/... doesn't count)
+_LOGGED_IN_URL = re.compile(r'^https://app\.youscan\.io/((themes|dashboard)(/|$|\?)|$)')
+# A single theme's pages, reached by clicking it in the themes list
+_THEME_URL = re.compile(r'^https://app\.youscan\.io/themes/\d+')
+
+# Tag dropdown options paired with their normalized (lowercase, stripped) form and its
+# length, computed once instead of per found tag for every entry
+_TAG_OPTIONS_LOWER = [
+    (tag_option, (tag_option_lower := tag_option.lower().strip()), len(tag_option_lower))
+    for tag_option in TAG_OPTIONS
+]
+# Normalized form -> option for exact matches (reversed so the first option wins on duplicates)
+_TAG_OPTIONS_BY_LOWER = {tag_option_lower: tag_option for tag_option, tag_option_lower, _ in reversed(_TAG_OPTIONS_LOWER)}
+
+# Requests the parser never needs: aborted by YouScanParser._block_resources.
+# Stylesheets are kept - visibility checks and clicks depend on the real layout
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+# Tracker hosts, matched as host suffixes so YouScan's own URLs (e.g. .../segments) are never hit
+_BLOCKED_HOST_SUFFIXES = (
+    'segment.io', 'segment.com', 'intercom.io', 'intercomcdn.com', 'google-analytics.com',
+    'googletagmanager.com', 'hotjar.com', 'mixpanel.com',
+)
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Return True if the URL's host is one of the tracker hosts or a subdomain of one."""
+    host = urlsplit(url).hostname or ''
+    return any(host == suffix or host.endswith('.' + suffix) for suffix in _BLOCKED_HOST_SUFFIXES)
+
+
+# Browser launch settings, built once at import
+_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',  # Hide automation
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-extensions',
+    '--mute-audio',
+    '--disable-features=IsolateOrigins,site-per-process',  # Fewer renderer processes
+)
+_PERSISTENT_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--mute-audio',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+# Added only when headless: nothing is painted on screen, so skip GPU initialization
+_HEADLESS_LAUNCH_ARGS = ('--disable-gpu',)
+# Realistic browser settings for new contexts (read-only; start_async copies it)
+_CONTEXT_OPTIONS = MappingProxyType({
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York',
+    'permissions': ['geolocation'],
+    'extra_http_headers': {
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+})
+
+
+def _is_stale_handle_error(error) -> bool:
+    """Check whether an error means the entry element handles went stale."""
+    if not isinstance(error, PlaywrightError):
+        return False
+    message = str(error).lower()
+    return any(stale_message in message for stale_message in _STALE_HANDLE_MESSAGES)
 
 
 class YouScanParser:
@@ -14,8 +153,287 @@ class YouScanParser:
     
     BASE_URL = "https://app.youscan.io"
     MENTIONS_URL = "https://app.youscan.io/themes/347025/mentions"
+    ENTRY_CONCURRENCY = 8  # Max entries parsed concurrently on one page
+    # Cookies/localStorage saved after a successful login, reused to skip the login form
+    STORAGE_STATE_PATH = Path.home() / '.bcl-parser' / 'storage_state.json'
+    # Elements a navigation actually waits for, instead of the full 'load' event
+    THEMES_READY_SELECTOR = 'text="Big City Lab"'  # Theme list item
+    MENTIONS_READY_SELECTOR = 'div[role="presentation"]'  # Date picker container
+    # Date range input; unlike the bare MUI container it is never rendered on /login
+    MENTIONS_LOADED_SELECTOR = 'div[role="presentation"] input[type="text"]:not([placeholder*="Пошук" i])'
+    
+    # Static selector lists, built once at class creation rather than per call
+    # Login form fields, in precedence order; each list is also joined into one selector
+    # so the wait races all of them, then _first_by_precedence_async picks the match
+    EMAIL_SELECTORS = (
+        'input[name="username"]',  # Correct selector based on actual HTML
+        'input[type="email"]',
+        'input[name="email"]',
+    )
+    EMAIL_SELECTOR = ', '.join(EMAIL_SELECTORS)
+    PASSWORD_SELECTORS = (
+        'input[name="password"]',  # Correct selector based on actual HTML
+        'input[type="password"]',
+    )
+    PASSWORD_SELECTOR = ', '.join(PASSWORD_SELECTORS)
+    # Submit button contains text "Увійти"
+    SUBMIT_SELECTORS = (
+        'button:has-text("Увійти")',  # Ukrainian "Login" - correct based on HTML
+        'button:has-text("Войти")',   # Russian "Login"
+        'button:has-text("Login")',    # English
+        'button[type="submit"]',
+        'button.FF3v4g9p2DiF4nP4L3yR',  # Specific class from HTML (may change)
+    )
+    # CSS fallbacks for entry containers when no numeric-ID entries are found
+    ENTRY_SELECTORS = (
+        'div[id^="7"]',  # IDs starting with 7
+        'div[id^="8"]',  # IDs starting with 8
+        'div[id^="9"]',  # IDs starting with 9
+        '[class*="mention"]',
+        '[class*="Mention"]',
+        '[class*="post"]',
+        '[class*="entry"]',
+        '[class*="item"]',
+        'article',
+        '[data-testid*="mention"]',
+        '[role="article"]',
+        'div[class*="card"]',
+        'div[class*="Card"]',
+    )
+    # Author name, most specific first (also used by ENTRY_FIELDS_JS). Each exact class
+    # selector (the browser's class fast path) comes before its [class*=] fallback
+    NAME_SELECTORS = (
+        'span.NR97fosTp2Dtw_WKVPAN',  # Author name class
+        'span[class*="NR97fosTp2Dtw"]',
+        'div.e99EkRyEQ2YU1HjaKz7j span',  # Author section
+        'div[class*="e99EkRyEQ2YU1HjaKz7j"] span',
+    )
+    # Note text containers when the specific note elements are missing
+    NOTE_CONTENT_SELECTORS = (
+        'div.yOPHd5XCBg3vO0C9GJNN, div.GcnHzy56qFW5AbYII5ig',  # Content wrapper / text container
+        'div[class*="yOPHd5XCBg3vO0C9GJNN"], div[class*="GcnHzy56qFW5AbYII5ig"]',
+        '[class*="content"], [class*="text"], p',  # Generic fallbacks
+    )
+    # href substrings marking a post link (used by ENTRY_FIELDS_JS); 'telegram' also covers telegram.me
+    POST_LINK_HREF_PARTS = (
+        'facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 't.me',
+        'telegram', 'tiktok', 'threads', 'soundcloud',
+    )
+    # Description block inside the username modal
+    DESCRIPTION_SELECTORS = (
+        'div.jrnY5tmnFg128QMOKSyq',  # Specific class from example
+        'div[class*="jrnY5tmn"]',  # Partial match
+        'div[class*="QMOKSyq"]',  # Another partial match
+        '[class*="description"]',
+        '[class*="bio"]',
+        '[class*="about"]',
+    )
+    
+    # Finds entry blocks: divs with purely numeric IDs (6+ digits) that look like an entry.
+    # Returns the elements themselves, in DOM order
+    FIND_ENTRIES_JS = """
+        () => {
+            // Numeric and at least 6 digits (typical for YouScan entry IDs like 777553656)
+            const NUMERIC_ID_RE = /^\\d{6,}$/;
+            const allDivs = document.querySelectorAll('div[id]');
+            const entryDivs = [];
+            for (const div of allDivs) {
+                if (NUMERIC_ID_RE.test(div.id)) {
+                    // Check if this div has the structure of an entry block
+                    // Look for: profile images, social network indicators, date links, or substantial text
+                    const hasProfileImg = div.querySelector('img[src*="api/image/get"], img[src*="profile"], img[src*="avatar"]');
+                    const hasSocialNetwork = div.querySelector('span[title*="facebook"], span[title*="instagram"], a[href*="facebook"], a[href*="instagram"]');
+                    const hasDateLink = div.querySelector('a[href*="facebook.com"], a[href*="instagram.com"]');
+                    const hasSubstantialText = div.textContent.trim().length > 100;
+
+                    // Must have at least one of these indicators
+                    if (hasProfileImg || hasSocialNetwork || hasDateLink || hasSubstantialText) {
+                        entryDivs.push(div);
+                    }
+                }
+            }
+            return entryDivs;
+        }
+    """
+    
+    # Collects the tag span texts of an entry (see _parse_tags_async for the HTML structure):
+    # spans in every child div of the izj773vLNpCIfNBWnzoQ wrapper except the first ("Стаття")
+    TAG_SPANS_JS = """
+        (el) => {
+            const found = [];
+            const seen = new Set();  // Mirrors found for O(1) duplicate checks
+            // Every span filter is a local DOM check, applied in the same pass that collects the spans
+            const addTagSpan = (span) => {
+                const text = span.textContent.trim();
+                
+                // Skip empty, single chars, close icons, "Стаття" and the "Додати тег" text
+                if (!text || text === 'x' || text === 'X' || text === 'Стаття' || text === 'Додати тег' || text.length < 2) return;
+                
+                // Skip if it's inside a button (like "Додати тег")
+                if (span.closest('button')) return;
+                
+                // Skip if it's just an icon (has icon but no text of its own)
+                if (span.querySelector('i.mdi') && !Array.from(span.childNodes).some(n => n.nodeType === 3 && n.textContent.trim())) return;
+                
+                // This looks like a tag - add it
+                if (!seen.has(text)) {
+                    seen.add(text);
+                    found.push(text);
+                }
+            };
+            // Find divs with class izj773vLNpCIfNBWnzoQ (stable container)
+            // [class*=] already matches the exact class too, so it is the de-duplicated union of
+            // both forms; an exact-only lookup would drop wrappers carrying a variant class
+            const tagWrappers = el.querySelectorAll('div[class*="izj773vLNpCIfNBWnzoQ"]');
+            for (const wrapper of tagWrappers) {
+                // Get all direct child divs (not nested)
+                const childDivs = Array.from(wrapper.children).filter(el => el.tagName === 'DIV');
+                if (childDivs.length === 0) continue;
+                
+                // Check ALL child divs (skip first one which usually has "Стаття")
+                // Start from index 1 to skip the first div
+                for (let i = 1; i < childDivs.length; i++) {
+                    const childDiv = childDivs[i];
+                    
+                    // Skip empty separator divs (like RynAcp3UczxMoGCp6Syp)
+                    const divText = childDiv.textContent.trim();
+                    if (!divText || divText.length === 0) continue;
+                    
+                    // Check if this div contains "Стаття" - if so, skip it
+                    if (divText.includes('Стаття') && divText.length < 20) {
+                        continue; // Skip divs that only contain "Стаття"
+                    }
+                    
+                    // Find ALL spans in this div - don't rely on specific container classes
+                    for (const span of childDiv.getElementsByTagName('span')) {
+                        addTagSpan(span);
+                    }
+                }
+            }
+            
+            // Fallback: spans of the tag div itself (l9Xop4gL9H3TgNeRAp2A) when the wrapper
+            // structure above did not match
+            if (found.length === 0) {
+                for (const tagDiv of el.querySelectorAll('div[class*="l9Xop4gL9H3TgNeRAp2A"]')) {
+                    for (const span of tagDiv.getElementsByTagName('span')) {
+                        addTagSpan(span);
+                    }
+                }
+            }
+            return found;
+        }
+    """
+    
+    # Reads the per-entry fields used by _parse_single_entry_async in one evaluate call,
+    # using the same selectors (and precedence) as the individual queries it replaces
+    ENTRY_FIELDS_JS = """
+        (el, [nameSelectors, noteContentSelectors, linkHrefParts, socialDomains]) => {
+            const text = (node) => node ? node.innerText : null;
+            // Exact class lookup first (class index, no selector parsing), [class*=] only when
+            // it finds nothing
+            const firstByClass = (className, loose) => el.getElementsByClassName(className)[0] || el.querySelector(loose);
+            
+            // Date link and post link (the date link contains the actual post URL), found in one
+            // walk over the entry's anchors: the first one with the date link class or an href
+            // containing one of POST_LINK_HREF_PARTS (only facebook/instagram for the date link)
+            // <a href="..." class="j0EW2HMfFh3MvBbwygOB">2 січня 2026 р., 14:37</a>
+            let dateElem = null;
+            let linkElem = null;
+            for (const anchor of el.getElementsByTagName('a')) {
+                const isDateLink = anchor.classList.contains('j0EW2HMfFh3MvBbwygOB');
+                const href = anchor.getAttribute('href') || '';
+                if (!dateElem && (isDateLink || href.includes('facebook') || href.includes('instagram'))) dateElem = anchor;
+                if (!linkElem && (isDateLink || linkHrefParts.some(part => href.includes(part)))) linkElem = anchor;
+                if (dateElem && linkElem) break;
+            }
+            const dateText = text(dateElem);
+            
+            // User name: first of NAME_SELECTORS whose element has a name longer than 2 chars
+            let name = '';
+            let nameElem = null;
+            for (const selector of nameSelectors) {
+                const found = el.querySelector(selector);
+                if (found) {
+                    nameElem = found;
+                    name = found.innerText.trim();
+                    if (name && name.length > 2) break;
+                }
+            }
+            
+            // Author profile link around the name, if any: identifies the author for the
+            // description cache (display names are not unique)
+            const authorAnchor = nameElem ? nameElem.closest('a[href]') : null;
+            const authorLink = authorAnchor && !authorAnchor.classList.contains('j0EW2HMfFh3MvBbwygOB') ? authorAnchor.href : null;
+            
+            const link = linkElem ? (linkElem.getAttribute('href') || '') : null;
+            
+            // Any other social network anchor (a SOCIAL_NETWORK_DOMAINS entry in the resolved href),
+            // only needed when the post link is missing or empty
+            let anchorLink = null;
+            if (!link) {
+                anchorLink = '';
+                for (const anchor of el.querySelectorAll('a[href]')) {
+                    const href = anchor.href.toLowerCase();
+                    if (socialDomains.some(domain => href.includes(domain))) {
+                        anchorLink = anchor.href;
+                        break;
+                    }
+                }
+            }
+            
+            // Social network name span, only needed when there is no link
+            // <span class="FnMtmUa9bs__3sxIz_4N BgNMJrrsKXup73BhMooc">facebook.com</span>
+            const socialText = linkElem ? null : text(firstByClass('FnMtmUa9bs__3sxIz_4N', 'span[class*="FnMtmUa9bs"]'));
+            
+            // Full entry text, only when the Python-side fallbacks will need it
+            // (name regex when no name span matched, Telegram check when there is no link)
+            const fullText = (!name || name.length < 2 || !linkElem) ? el.innerText : null;
+            
+            // Note (Примітки), primary source: user action text after the username
+            // <div class="e99EkRyEQ2YU1HjaKz7j">Невідомий користувач<span> </span>відповів(ла) на коментар...
+            const noteActionText = text(firstByClass('e99EkRyEQ2YU1HjaKz7j', 'div[class*="e99EkRyEQ2YU1HjaKz7j"]'));
+            
+            // Note fallbacks: main paragraph, then distinct additional text spans; filter out UI
+            // elements and very short text. If neither is present, the first content container
+            const noteParts = [];
+            const seenParts = new Set();  // Mirrors noteParts for O(1) duplicate checks
+            const mainText = (text(firstByClass('VqFKkdgOknQMdibReX6Y', 'p[class*="VqFKkdgOknQMdibReX6Y"]')) || '').trim();
+            if (mainText) {
+                noteParts.push(mainText);
+                seenParts.add(mainText);
+            }
+            // All spans, not just exact-class ones ([class*=] covers both forms)
+            for (const span of el.querySelectorAll('span[class*="Q73iQ9Oh3QBkbjh10U6t"]')) {
+                const spanText = span.innerText.trim();
+                if (spanText && spanText.length > 10 && !spanText.includes('Перекласти') && !spanText.includes('Додати тег') && !seenParts.has(spanText)) {
+                    noteParts.push(spanText);
+                    seenParts.add(spanText);
+                }
+            }
+            if (noteParts.length === 0) {
+                for (const selector of noteContentSelectors) {
+                    const contentText = (text(el.querySelector(selector)) || '').trim();
+                    if (contentText && contentText.length > 20 && !contentText.includes('Додати тег') && !contentText.includes('Перекласти')) {
+                        noteParts.push(contentText);
+                        break;
+                    }
+                }
+            }
+            
+            // Tag span texts, matched against TAG_OPTIONS by _parse_tags_async
+            const tagSpans = (""" + TAG_SPANS_JS + """)(el);
+            
+            return {dateText, name, authorLink, link, anchorLink, socialText, fullText, noteActionText, noteParts, tagSpans};
+        }
+    """
+    # ENTRY_FIELDS_JS over every entry of a page, and the selector argument both take;
+    # built once here instead of per page/entry
+    ENTRY_FIELDS_BATCH_JS = f"([entries, selectors]) => entries.map(el => ({ENTRY_FIELDS_JS})(el, selectors))"
+    ENTRY_FIELDS_ARG = [list(NAME_SELECTORS), list(NOTE_CONTENT_SELECTORS), list(POST_LINK_HREF_PARTS),
+                        list(SOCIAL_NETWORK_DOMAINS)]
     
-    def __init__(self, email: str, password: str, headless: bool = True, use_persistent_context: bool = False):
+    def __init__(self, email: str, password: str, headless: bool = True, use_persistent_context: bool = False,
+                 cdp_endpoint: Optional[str] = None, browser_channel: Optional[str] = None):
         """Initialize parser with credentials.
         
         Args:
@@ -23,15 +441,31 @@ class YouScanParser:
             password: YouScan.io password
             headless: Run browser in headless mode
             use_persistent_context: Use persistent browser context (saves cookies/session)
+            cdp_endpoint: Connect to an already running Chromium at this CDP endpoint
+                (e.g. "http://127.0.0.1:9222" for one started with --remote-debugging-port=9222)
+                instead of launching a new browser; close() then leaves that browser running
+            browser_channel: Launch an installed browser build instead of the bundled Chromium
+                (e.g. "chrome"); real Chrome needs no navigator stealth overrides
         """
         self.email = email
         self.password = password
         self.headless = headless
         self.use_persistent_context = use_persistent_context
+        self.cdp_endpoint = cdp_endpoint
+        self.browser_channel = browser_channel
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # Entries are parsed concurrently, but clicks that open the username modal share
+        # the single page, so those interactions are serialized through this lock
+        self._interaction_lock = asyncio.Lock()
+        # Failure screenshots force a full page paint and disk write, so they are opt-in
+        self._debug = os.getenv('BCL_PW_DEBUG') == '1'
+        self._screenshot_taken = False  # "No entries" debug screenshot is taken once per session
+        self._next_btn_locator = None  # Built lazily by _get_next_button_locator()
+        self._desc_cache: Dict[str, str] = {}  # Author profile link -> description ("Хто це")
+        self._page_desc_cache: Dict[str, str] = {}  # User name -> description, current page only
     
     def __enter__(self):
         """Context manager entry."""
@@ -46,46 +480,27 @@ class YouScanParser:
         """Start browser and login (async version for use in threads)."""
         self.playwright = await async_playwright().start()
         
-        # Launch browser with stealth settings to avoid detection
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',  # Hide automation
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-            ]
-        )
-        
-        # Create context with realistic browser settings
-        context_options = {
-            'viewport': {'width': 1920, 'height': 1080},
-            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'locale': 'en-US',
-            'timezone_id': 'America/New_York',
-            'permissions': ['geolocation'],
-            'extra_http_headers': {
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-        }
+        # Create context with realistic browser settings (copied: storage_state may be added)
+        context_options = dict(_CONTEXT_OPTIONS)
         
+        if self.cdp_endpoint:
+            # Reuse an already running browser: no Chromium launch, and its profile keeps the session
+            self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+            if self.browser.contexts:
+                self.context = self.browser.contexts[0]
+            else:
+                self.context = await self.browser.new_context(**context_options)
+            self.page = await self.context.new_page()
         # Use persistent context if requested (saves cookies/session)
-        if self.use_persistent_context:
-            from pathlib import Path
+        elif self.use_persistent_context:
             user_data_dir = Path.home() / '.bcl-parser' / 'browser_data'
             user_data_dir.mkdir(parents=True, exist_ok=True)
             self.context = await self.playwright.chromium.launch_persistent_context(
                 str(user_data_dir),
                 headless=self.headless,
+                channel=self.browser_channel,
                 **context_options,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                ]
+                args=_PERSISTENT_LAUNCH_ARGS + (_HEADLESS_LAUNCH_ARGS if self.headless else ())
             )
             # Get the first page from persistent context
             if self.context.pages and len(self.context.pages) > 0:
@@ -93,15 +508,36 @@ class YouScanParser:
             else:
                 self.page = await self.context.new_page()
         else:
+            # Launch browser with stealth settings to avoid detection
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                channel=self.browser_channel,
+                args=_LAUNCH_ARGS + (_HEADLESS_LAUNCH_ARGS if self.headless else ())
+            )
+            if self.STORAGE_STATE_PATH.exists():
+                context_options['storage_state'] = str(self.STORAGE_STATE_PATH)
             self.context = await self.browser.new_context(**context_options)
             self.page = await self.context.new_page()
         
         # Verify page is initialized
         if self.page is None:
             raise ValueError("Failed to initialize page object")
+        self._next_btn_locator = None  # Bound to the previous page, if any
+        
+        # Over CDP the context is the user's own browser profile: route and inject only into
+        # the parser's page so the user's other tabs are left alone
+        scope = self.page if self.cdp_endpoint else self.context
+        
+        # Skip images, fonts, media and analytics for every page of this context
+        await scope.route("**/*", self._block_resources)
+        
+        # Define the entry finder once per context so per-page lookups only send a short call
+        await scope.add_init_script(f"window.__bclFindEntries = {self.FIND_ENTRIES_JS};")
         
-        # Remove webdriver property to avoid detection (only if not persistent context)
-        if not self.use_persistent_context:
+        # Remove webdriver property to avoid detection (only for a fresh bundled Chromium:
+        # persistent profiles and real Chrome channels are left untouched, saving the
+        # script's run on every document)
+        if not self.use_persistent_context and not self.browser_channel:
             await self.page.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
@@ -128,100 +564,68 @@ class YouScanParser:
         
         await self._login_async()
     
+    @staticmethod
+    async def _block_resources(route, request):
+        """Abort requests the parser doesn't need, continue everything else (XHR/fetch/scripts)."""
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def close_async(self):
-        """Close browser (async version)."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        """Close browser (async version). Safe to call more than once."""
+        page, context, browser, playwright = self.page, self.context, self.browser, self.playwright
+        self.page = self.context = self.browser = self.playwright = None
+        if self.cdp_endpoint:
+            # Shared browser: close only our page; browser.close() just disconnects
+            if page:
+                await page.close()
+        elif context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if playwright:
+            await playwright.stop()
     
     def close(self):
         """Close browser (sync wrapper for compatibility)."""
         if self.context or self.browser or self.playwright:
-            # Run async close in event loop
+            # Run async close in event loop (get_event_loop() is deprecated without a running loop)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is running, create task
-                    asyncio.create_task(self.close_async())
+                if loop:
+                    # If loop is running, schedule the close on it
+                    loop.create_task(self.close_async())
                 else:
-                    loop.run_until_complete(self.close_async())
-            except:
+                    asyncio.run(self.close_async())
+            except (PlaywrightError, RuntimeError):
                 pass
     
     async def _login_async(self):
         """Login to YouScan.io (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             # Ensure page is initialized
             if self.page is None:
                 raise ValueError("Page not initialized - browser may not have started correctly")
             
-            # First, check if already logged in
-            # page.url is a property, not a method, so no await needed
-            try:
-                current_url = str(self.page.url)  # Explicitly convert to string
-            except Exception as e:
-                logger.error(f"Error accessing page.url: {e}, page type: {type(self.page)}")
-                print(f"[ERROR] Error accessing page.url: {e}, page type: {type(self.page)}")
-                raise
-            
-            logger.info(f"Checking current page: {current_url}")
-            print(f"[INFO] Checking current page: {current_url}")
-            
-            # Navigate to login page
-            logger.info(f"Navigating to {self.BASE_URL}/login")
-            print(f"[INFO] Navigating to {self.BASE_URL}/login")
+            # Go straight to mentions: with a valid session (persistent profile or saved state)
+            # YouScan serves it and the form is skipped entirely, otherwise it redirects to /login
+            logger.info(f"Navigating to {self.MENTIONS_URL}")
             # Use 'domcontentloaded' instead of 'load' - faster and more reliable
             # 'load' waits for all resources, which can timeout on slow networks
             try:
-                await self.page.goto(f"{self.BASE_URL}/login", wait_until='domcontentloaded', timeout=60000)
-            except Exception as goto_error:
-                # If timeout, try with even less strict wait or check if page loaded anyway
+                await self.page.goto(self.MENTIONS_URL, wait_until='domcontentloaded', timeout=60000)
+                # The redirect to /login can happen client-side, so wait for either the
+                # mentions page's own date input or the login form before reading the URL
+                await self.page.locator(f'{self.MENTIONS_LOADED_SELECTOR}, {self.EMAIL_SELECTOR}').first.wait_for(state='visible', timeout=15000)
+            except _PLAYWRIGHT_ERRORS as goto_error:
                 logger.warning(f"Initial navigation timed out: {goto_error}, checking current URL")
-                print(f"[WARNING] Initial navigation timed out, checking current URL")
-                current_url = self.page.url
-                logger.info(f"Current URL after timeout: {current_url}")
-                print(f"[INFO] Current URL after timeout: {current_url}")
-                
-                # If we're already on a valid page (themes, dashboard), continue
-                if '/themes' in current_url or '/dashboard' in current_url or current_url != 'about:blank':
-                    logger.info("Page loaded despite timeout, continuing")
-                    print("[INFO] Page loaded despite timeout, continuing")
-                else:
-                    # Try one more time with 'commit' wait (least strict)
-                    try:
-                        logger.info("Retrying navigation with 'commit' wait")
-                        print("[INFO] Retrying navigation with 'commit' wait")
-                        await self.page.goto(f"{self.BASE_URL}/login", wait_until='commit', timeout=30000)
-                        await asyncio.sleep(2)  # Wait for page to render
-                    except Exception as retry_error:
-                        logger.error(f"Navigation failed even with retry: {retry_error}")
-                        print(f"[ERROR] Navigation failed even with retry: {retry_error}")
-                        raise
-            
-            # Check current URL - might already be logged in
+            
             current_url = self.page.url
             logger.info(f"Current URL after navigation: {current_url}")
-            print(f"[INFO] Current URL after navigation: {current_url}")
-            
-            # Check if already logged in (redirected to themes or dashboard)
-            if '/themes' in current_url or '/dashboard' in current_url or current_url == f"{self.BASE_URL}/":
-                logger.info("Already logged in! Skipping login form")
-                print("[INFO] Already logged in! Skipping login form")
-                # Make sure we're on themes page
-                if '/themes' not in current_url:
-                    await self.page.goto(f"{self.BASE_URL}/themes", wait_until='load', timeout=30000)
-                    await asyncio.sleep(2)
-                # Skip login and go directly to navigation
-                logger.info("Navigating to Big City Lab theme mentions")
-                print("[INFO] Navigating to Big City Lab theme mentions")
-                await self._navigate_to_big_city_lab_async()
-                return
             
             if 'unsupported' in current_url.lower():
                 error_msg = (
@@ -232,430 +636,237 @@ class YouScanParser:
                     "3. You may need to manually log in once, then the app can use saved session"
                 )
                 logger.error(error_msg)
-                print(f"[ERROR] {error_msg}")
                 
-                # Take screenshot for debugging
-                try:
-                    screenshot_path = 'unsupported_page_debug.png'
-                    await self.page.screenshot(path=screenshot_path)
-                    print(f"[DEBUG] Screenshot saved to {screenshot_path}")
-                except:
-                    pass
+                await self._debug_screenshot_async('unsupported_page_debug.png')
                 
                 raise ValueError("Browser detected as automated - redirected to unsupported page")
             
-            logger.info("Page loaded, waiting for login form")
-            print("[INFO] Page loaded, waiting for login form")
-            
-            # Wait a bit for page to render (redirect might happen asynchronously)
-            await asyncio.sleep(3)  # Increased wait time
-            
-            # Check URL again - redirect might have happened during wait
-            current_url_after_wait = self.page.url
-            logger.info(f"Current URL after wait: {current_url_after_wait}")
-            print(f"[INFO] Current URL after wait: {current_url_after_wait}")
-            
-            # Check if already logged in (redirected to themes or dashboard)
-            if '/themes' in current_url_after_wait or '/dashboard' in current_url_after_wait or current_url_after_wait == f"{self.BASE_URL}/":
-                logger.info("Already logged in! Redirected to themes page. Skipping login form")
-                print("[INFO] Already logged in! Redirected to themes page. Skipping login form")
-                # Make sure we're on themes page
-                if '/themes' not in current_url_after_wait:
-                    await self.page.goto(f"{self.BASE_URL}/themes", wait_until='load', timeout=30000)
-                    await asyncio.sleep(2)
-                # Navigate to Big City Lab theme mentions page
-                logger.info("Navigating to Big City Lab theme mentions")
-                print("[INFO] Navigating to Big City Lab theme mentions")
-                await self._navigate_to_big_city_lab_async()
-                return  # Skip login, already authenticated
-            
-            # Based on actual HTML: email input has name="username"
-            email_selectors = [
-                'input[name="username"]',  # Correct selector based on actual HTML
-                'input[type="email"]',
-                'input[name="email"]',
-            ]
-            
-            email_input = None
-            for selector in email_selectors:
-                try:
-                    # Check URL before each selector attempt - redirect might happen during wait
-                    check_url = self.page.url
-                    if '/themes' in check_url or '/dashboard' in check_url:
-                        logger.info(f"Redirected to {check_url} while waiting for selector - already logged in!")
-                        print(f"[INFO] Redirected to {check_url} while waiting for selector - already logged in!")
-                        await self._navigate_to_big_city_lab_async()
-                        return
-                    
-                    logger.debug(f"Trying email selector: {selector}")
-                    print(f"[DEBUG] Trying email selector: {selector}")
-                    email_input = await self.page.wait_for_selector(selector, timeout=5000, state='visible')
-                    if email_input:
-                        logger.info(f"Found email input with selector: {selector}")
-                        print(f"[INFO] Found email input with selector: {selector}")
-                        break
-                except Exception as e:
-                    # Check URL after selector timeout - might have redirected
-                    check_url = self.page.url
-                    if '/themes' in check_url or '/dashboard' in check_url:
-                        logger.info(f"Redirected to {check_url} during selector wait - already logged in!")
-                        print(f"[INFO] Redirected to {check_url} during selector wait - already logged in!")
-                        await self._navigate_to_big_city_lab_async()
-                        return
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
-            
-            if not email_input:
-                # Check URL one more time - might have redirected while waiting
-                final_url = self.page.url
-                logger.info(f"Final URL check: {final_url}")
-                print(f"[INFO] Final URL check: {final_url}")
-                
-                if '/themes' in final_url or '/dashboard' in final_url:
-                    logger.info("Redirected to themes during wait - already logged in!")
-                    print("[INFO] Redirected to themes during wait - already logged in!")
+            if '/login' not in current_url:
+                if 'mentions' in current_url:
+                    logger.info("Already logged in! Skipping login form")
+                    return
+                if _LOGGED_IN_URL.search(current_url):
+                    logger.info("Already logged in! Navigating to Big City Lab theme mentions")
                     await self._navigate_to_big_city_lab_async()
                     return
-                
-                # Take screenshot for debugging
-                screenshot_path = 'login_page_debug.png'
-                await self.page.screenshot(path=screenshot_path)
-                page_title = await self.page.title()
-                logger.error(f"Could not find email input. Screenshot saved to {screenshot_path}")
-                print(f"[ERROR] Could not find email input. Screenshot saved to {screenshot_path}")
-                print(f"[DEBUG] Current URL: {self.page.url}")
-                print(f"[DEBUG] Page title: {page_title}")
-                raise ValueError("Could not find email input field on login page")
-            
-            # Password input has name="password" - this should work
-            password_selectors = [
-                'input[name="password"]',  # Correct selector based on actual HTML
-                'input[type="password"]',
-            ]
-            
-            password_input = None
-            for selector in password_selectors:
+                # Navigation failed or landed elsewhere - open the login page explicitly
+                logger.info(f"Navigating to {self.BASE_URL}/login")
                 try:
-                    logger.debug(f"Trying password selector: {selector}")
-                    print(f"[DEBUG] Trying password selector: {selector}")
-                    password_input = await self.page.wait_for_selector(selector, timeout=5000, state='visible')
-                    if password_input:
-                        logger.info(f"Found password input with selector: {selector}")
-                        print(f"[INFO] Found password input with selector: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+                    await self.page.goto(f"{self.BASE_URL}/login", wait_until='domcontentloaded', timeout=60000)
+                except _PLAYWRIGHT_ERRORS:
+                    # Try one more time with 'commit' wait (least strict)
+                    logger.info("Retrying navigation with 'commit' wait")
+                    await self.page.goto(f"{self.BASE_URL}/login", wait_until='commit', timeout=30000)
             
-            if not password_input:
-                raise ValueError("Could not find password input field on login page")
+            logger.info("Page loaded, waiting for login form")
             
-            # Double-check we're still on login page before filling (redirect might have happened)
-            final_check_url = self.page.url
-            if '/themes' in final_check_url or '/dashboard' in final_check_url or '/login' not in final_check_url:
-                logger.info(f"Redirected to {final_check_url} before filling form - already logged in!")
-                print(f"[INFO] Redirected to {final_check_url} before filling form - already logged in!")
-                await self._navigate_to_big_city_lab_async()
-                return
+            # All selectors are raced in one locator, so a wrong first selector no longer
+            # costs its own timeout; the field itself is then chosen by precedence
+            try:
+                await self.page.locator(self.EMAIL_SELECTOR).first.wait_for(state='visible', timeout=8000)
+            except _PLAYWRIGHT_ERRORS as e:
+                logger.debug(f"Email input not found: {e}")
+                logger.error("Could not find email input")
+                await self._debug_screenshot_async('login_page_debug.png')
+                raise ValueError("Could not find email input field on login page")
+            email_input = await self._first_by_precedence_async(self.EMAIL_SELECTORS)
+            if email_input is None:
+                raise ValueError("Could not find email input field on login page")
+            logger.info("Found email input")
             
-            # Verify elements are still attached to DOM before filling
             try:
-                # Check if email input is still attached
-                is_attached = await email_input.evaluate('el => el.isConnected')
-                if not is_attached:
-                    # Re-query the element
-                    email_input = await self.page.query_selector('input[name="username"]')
-                    if not email_input:
-                        raise ValueError("Email input was detached from DOM")
-                
-                # Check if password input is still attached
-                is_attached = await password_input.evaluate('el => el.isConnected')
-                if not is_attached:
-                    # Re-query the element
-                    password_input = await self.page.query_selector('input[name="password"]')
-                    if not password_input:
-                        raise ValueError("Password input was detached from DOM")
-            except Exception as e:
-                # Check URL again - might have redirected
-                check_url = self.page.url
-                if '/themes' in check_url or '/dashboard' in check_url:
-                    logger.info(f"Redirected to {check_url} during element check - already logged in!")
-                    print(f"[INFO] Redirected to {check_url} during element check - already logged in!")
-                    await self._navigate_to_big_city_lab_async()
-                    return
-                raise ValueError(f"Elements detached from DOM: {e}")
+                await self.page.locator(self.PASSWORD_SELECTOR).first.wait_for(state='visible', timeout=5000)
+            except _PLAYWRIGHT_ERRORS as e:
+                logger.debug(f"Password input not found: {e}")
+                raise ValueError("Could not find password input field on login page")
+            password_input = await self._first_by_precedence_async(self.PASSWORD_SELECTORS)
+            if password_input is None:
+                raise ValueError("Could not find password input field on login page")
+            logger.info("Found password input")
             
-            # Fill credentials
+            # Fill credentials - locators re-resolve (and retry) if the form re-renders
             logger.info("Filling email")
-            print("[INFO] Filling email")
             try:
                 await email_input.fill(self.email)
-                await asyncio.sleep(0.5)
             except Exception as e:
-                # Check if redirected during fill
-                check_url = self.page.url
-                if '/themes' in check_url or '/dashboard' in check_url:
-                    logger.info(f"Redirected to {check_url} during email fill - already logged in!")
-                    print(f"[INFO] Redirected to {check_url} during email fill - already logged in!")
-                    await self._navigate_to_big_city_lab_async()
-                    return
                 raise ValueError(f"Failed to fill email: {e}")
             
             logger.info("Filling password")
-            print("[INFO] Filling password")
             try:
                 await password_input.fill(self.password)
-                await asyncio.sleep(0.5)
             except Exception as e:
-                # Check if redirected during fill
-                check_url = self.page.url
-                if '/themes' in check_url or '/dashboard' in check_url:
-                    logger.info(f"Redirected to {check_url} during password fill - already logged in!")
-                    print(f"[INFO] Redirected to {check_url} during password fill - already logged in!")
-                    await self._navigate_to_big_city_lab_async()
-                    return
                 raise ValueError(f"Failed to fill password: {e}")
             
             # Submit form - button contains text "Увійти"
             logger.info("Looking for submit button")
-            print("[INFO] Looking for submit button")
-            submit_selectors = [
-                'button:has-text("Увійти")',  # Ukrainian "Login" - correct based on HTML
-                'button:has-text("Войти")',   # Russian "Login"
-                'button:has-text("Login")',    # English
-                'button[type="submit"]',
-                'button.FF3v4g9p2DiF4nP4L3yR',  # Specific class from HTML (may change)
-            ]
-            
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    submit_button = await self.page.query_selector(selector)
-                    if submit_button:
-                        logger.info(f"Found submit button with selector: {selector}")
-                        print(f"[INFO] Found submit button with selector: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Submit button selector {selector} failed: {e}")
-                    continue
+            submit_button = await self._first_by_precedence_async(self.SUBMIT_SELECTORS)
             
-            if submit_button:
+            if submit_button is not None:
                 logger.info("Clicking submit button")
-                print("[INFO] Clicking submit button")
                 await submit_button.click()
             else:
                 # Try pressing Enter
                 logger.info("No submit button found, pressing Enter")
-                print("[INFO] No submit button found, pressing Enter")
                 await password_input.press('Enter')
             
             # Wait for navigation to dashboard
             logger.info("Waiting for login to complete...")
-            print("[INFO] Waiting for login to complete...")
             try:
-                await self.page.wait_for_url('**/themes**', timeout=30000)
+                await self.page.wait_for_url(_LOGGED_IN_URL, timeout=30000)
                 logger.info("Login successful, navigated to themes page")
-                print("[INFO] Login successful, navigated to themes page")
-            except:
+            except _PLAYWRIGHT_ERRORS:
                 # Check if we're logged in by looking for dashboard elements
                 logger.warning("URL didn't change, checking if login was successful")
-                print("[WARNING] URL didn't change, checking if login was successful")
                 current_url = self.page.url
                 logger.info(f"Current URL: {current_url}")
-                print(f"[INFO] Current URL: {current_url}")
                 
                 # If we're still on login page, login might have failed
                 if '/login' in current_url:
                     raise ValueError("Login failed - still on login page")
             
-            await asyncio.sleep(2)  # Additional wait for page to fully load
+            await self._save_storage_state_async()
             
             # Navigate to Big City Lab theme mentions page
             logger.info("Navigating to Big City Lab theme mentions")
-            print("[INFO] Navigating to Big City Lab theme mentions")
             await self._navigate_to_big_city_lab_async()
             
         except Exception as e:
             logger.exception("Login error")
-            print(f"[ERROR] Login error: {str(e)}")
-            # Take screenshot for debugging
-            try:
-                screenshot_path = 'login_error_debug.png'
-                await self.page.screenshot(path=screenshot_path)
-                print(f"[DEBUG] Screenshot saved to {screenshot_path}")
-            except:
-                pass
+            if isinstance(e, ValueError) and str(e).startswith("Login failed"):
+                # The saved session is no longer accepted - don't reuse it next time
+                self.STORAGE_STATE_PATH.unlink(missing_ok=True)
+            await self._debug_screenshot_async('login_error_debug.png')
             raise
     
+    async def _first_by_precedence_async(self, selectors) -> Optional[Locator]:
+        """Return the first selector in the list with a visible match (async version).
+        
+        A comma-joined selector (or an or_() chain) resolves .first in DOM order, not in
+        the order the selectors are listed, so it is only used to race the wait.
+        """
+        for selector in selectors:
+            locator = self.page.locator(f'{selector} >> visible=true')
+            if await locator.count():
+                return locator.first
+        return None
+    
+    async def _debug_screenshot_async(self, screenshot_path: str):
+        """Save a debugging screenshot with BCL_PW_DEBUG=1, otherwise log the page URL and title (async version)."""
+        try:
+            if self._debug:
+                await self.page.screenshot(path=screenshot_path)
+                logger.info(f"Screenshot saved to {screenshot_path}")
+            else:
+                logger.info(f"Page at failure: {self.page.url} ({await self.page.title()})")
+        except _PLAYWRIGHT_ERRORS + (OSError,):
+            pass
+    
+    async def _goto_async(self, url: str, ready_selector: str):
+        """Navigate to a URL and wait only for the element the next step needs (async version)."""
+        await self.page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        try:
+            await self.page.wait_for_selector(ready_selector, state='visible', timeout=15000)
+        except _PLAYWRIGHT_ERRORS as e:
+            # The callers have their own fallbacks for a missing element
+            logger.debug(f"{ready_selector} not visible after navigating to {url}: {e}")
+    
+    async def _save_storage_state_async(self):
+        """Save session cookies/localStorage so the next start can skip login (async version)."""
+        if self.cdp_endpoint:
+            # The connected browser keeps its own session; its profile's cookies and
+            # localStorage must not be written to disk
+            return
+        try:
+            self.STORAGE_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            await self.context.storage_state(path=str(self.STORAGE_STATE_PATH))
+            logger.info(f"Saved session state to {self.STORAGE_STATE_PATH}")
+        except (PlaywrightError, OSError) as e:
+            logger.warning(f"Could not save session state: {e}")
+    
     async def _navigate_to_big_city_lab_async(self):
         """Navigate to Big City Lab theme mentions page (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            # First, make sure we're on the themes page
+            # The theme ID is part of MENTIONS_URL, so open the mentions page directly
+            await self._goto_async(self.MENTIONS_URL, self.MENTIONS_READY_SELECTOR)
             current_url = self.page.url
-            logger.info(f"Current URL before navigation: {current_url}")
-            print(f"[INFO] Current URL before navigation: {current_url}")
+            logger.info(f"URL after direct navigation: {current_url}")
+            
+            if '/mentions' in current_url:
+                logger.info("Successfully navigated to Big City Lab mentions page")
+                return
             
+            # Redirected away (e.g. back to the themes list) - pick the theme there instead
             if '/themes' not in current_url:
                 logger.info("Not on themes page, navigating to themes")
-                print("[INFO] Not on themes page, navigating to themes")
-                await self.page.goto(f"{self.BASE_URL}/themes", wait_until='load', timeout=30000)
-                await asyncio.sleep(3)
+                await self._goto_async(f"{self.BASE_URL}/themes", self.THEMES_READY_SELECTOR)
             
-            # Look for Big City Lab theme - try multiple strategies
+            # Look for Big City Lab theme; click() waits for it, scrolls it into view and
+            # checks it is actionable, so no manual parent/coordinate fallbacks are needed
             logger.info("Looking for Big City Lab theme")
-            print("[INFO] Looking for Big City Lab theme")
-            
-            # Strategy 1: Use Playwright's get_by_text (most reliable)
             theme_clicked = False
             try:
-                logger.debug("Trying Playwright get_by_text('Big City Lab')")
-                print("[DEBUG] Trying Playwright get_by_text('Big City Lab')")
-                theme_locator = self.page.get_by_text("Big City Lab", exact=True).first
-                if await theme_locator.is_visible(timeout=5000):
-                    logger.info("Found Big City Lab using get_by_text")
-                    print("[INFO] Found Big City Lab using get_by_text")
-                    await theme_locator.click()
-                    theme_clicked = True
-                    await asyncio.sleep(3)
-                    
-                    # After clicking, navigate directly to mentions page
-                    logger.info("Navigating to mentions page after clicking theme")
-                    print("[INFO] Navigating to mentions page after clicking theme")
-                    await self.page.goto(self.MENTIONS_URL, wait_until='load', timeout=30000)
-                    await asyncio.sleep(2)
-            except Exception as e:
-                logger.debug(f"get_by_text failed: {e}")
-                print(f"[DEBUG] get_by_text failed: {e}")
+                await self.page.get_by_text("Big City Lab", exact=True).first.click(timeout=8000)
+                logger.info("Clicked on Big City Lab theme")
+                theme_clicked = True
+            except _PLAYWRIGHT_ERRORS as e:
+                logger.debug(f"Theme click failed: {e}")
+            
+            if theme_clicked:
+                # The click is a client-side route change, so the load state is already
+                # reached; wait for the theme's own URL instead
+                try:
+                    await self.page.wait_for_url(_THEME_URL, timeout=10000)
+                except _PLAYWRIGHT_ERRORS as e:
+                    logger.debug(f"Theme page URL not reached after click: {e}")
             
-            # Strategy 2: Try other selectors
-            if not theme_clicked:
-                theme_selectors = [
-                    'text="Big City Lab"',
-                    'a:has-text("Big City Lab")',
-                    'div:has-text("Big City Lab")',
-                    '[href*="347025"]',
-                    'a[href*="/themes/347025"]',
-                ]
-                
-                for selector in theme_selectors:
-                    try:
-                        logger.debug(f"Trying selector: {selector}")
-                        print(f"[DEBUG] Trying selector: {selector}")
-                        element = await self.page.wait_for_selector(selector, timeout=3000, state='visible')
-                        if element:
-                            logger.info(f"Found Big City Lab with selector: {selector}")
-                            print(f"[INFO] Found Big City Lab with selector: {selector}")
-                            
-                            # Try to click it
-                            try:
-                                await element.click()
-                                logger.info("Clicked on Big City Lab theme")
-                                print("[INFO] Clicked on Big City Lab theme")
-                                theme_clicked = True
-                                await asyncio.sleep(3)
-                                break
-                            except Exception as click_error:
-                                logger.debug(f"Click failed: {click_error}, trying parent or coordinates")
-                                print(f"[DEBUG] Click failed, trying parent or coordinates")
-                                # Try clicking parent
-                                try:
-                                    parent = await element.evaluate_handle('el => el.closest("a") || el.closest("div[role="button"]") || el.parentElement')
-                                    if parent:
-                                        await parent.click()
-                                        theme_clicked = True
-                                        await asyncio.sleep(3)
-                                        break
-                                except:
-                                    # Try clicking by coordinates
-                                    try:
-                                        box = await element.bounding_box()
-                                        if box:
-                                            logger.info("Clicking by coordinates")
-                                            print("[INFO] Clicking by coordinates")
-                                            await self.page.mouse.click(box['x'] + box['width']/2, box['y'] + box['height']/2)
-                                            theme_clicked = True
-                                            await asyncio.sleep(3)
-                                            break
-                                    except:
-                                        continue
-                    except Exception as e:
-                        logger.debug(f"Selector {selector} failed: {e}")
-                        continue
-            
-            # Strategy 2: If clicking didn't work, try direct navigation
+            # If clicking didn't work, try direct navigation
             if not theme_clicked:
                 logger.info("Could not click theme, trying direct navigation")
-                print("[INFO] Could not click theme, trying direct navigation")
-                await self.page.goto(self.MENTIONS_URL, wait_until='load', timeout=30000)
-                await asyncio.sleep(3)
+                await self._goto_async(self.MENTIONS_URL, self.MENTIONS_READY_SELECTOR)
             else:
-                # After clicking, always navigate directly to mentions page
                 current_url = self.page.url
                 logger.info(f"URL after clicking theme: {current_url}")
-                print(f"[INFO] URL after clicking theme: {current_url}")
                 
-                # Always navigate to mentions page after clicking theme
-                logger.info("Navigating to mentions page")
-                print("[INFO] Navigating to mentions page")
-                await self.page.goto(self.MENTIONS_URL, wait_until='load', timeout=30000)
-                await asyncio.sleep(2)
+                # Navigate to mentions page unless the click already led there
+                if '/mentions' not in current_url:
+                    logger.info("Navigating to mentions page")
+                    await self._goto_async(self.MENTIONS_URL, self.MENTIONS_READY_SELECTOR)
             
             # Verify we're on the mentions page
             final_url = self.page.url
             logger.info(f"Final URL: {final_url}")
-            print(f"[INFO] Final URL: {final_url}")
             
             # If we're still on themes page (not mentions), navigate directly
             if '/themes' in final_url and '/mentions' not in final_url:
                 logger.warning(f"Still on themes page ({final_url}), navigating directly to mentions")
-                print(f"[WARNING] Still on themes page ({final_url}), navigating directly to mentions")
-                await self.page.goto(self.MENTIONS_URL, wait_until='load', timeout=30000)
-                await asyncio.sleep(2)
+                await self._goto_async(self.MENTIONS_URL, self.MENTIONS_READY_SELECTOR)
                 final_url = self.page.url
                 logger.info(f"Final URL after direct navigation: {final_url}")
-                print(f"[INFO] Final URL after direct navigation: {final_url}")
             
             if '/mentions' in final_url:
                 logger.info("Successfully navigated to Big City Lab mentions page")
-                print("[INFO] Successfully navigated to Big City Lab mentions page")
             else:
                 logger.warning(f"May not be on correct page. URL: {final_url}")
-                print(f"[WARNING] May not be on correct page. URL: {final_url}")
                 
         except Exception as e:
             logger.exception("Error navigating to Big City Lab")
-            print(f"[ERROR] Error navigating to Big City Lab: {str(e)}")
-            import traceback
-            traceback.print_exc()
             # Try direct URL as fallback
             try:
                 logger.info("Trying direct URL as fallback")
-                print("[INFO] Trying direct URL as fallback")
-                await self.page.goto(self.MENTIONS_URL, wait_until='load', timeout=30000)
-                await asyncio.sleep(3)
+                await self._goto_async(self.MENTIONS_URL, self.MENTIONS_READY_SELECTOR)
             except Exception as fallback_error:
                 logger.error(f"Fallback navigation also failed: {fallback_error}")
-                print(f"[ERROR] Fallback navigation also failed: {fallback_error}")
                 raise
     
     async def set_date_range_async(self, date_from: date, date_to: date):
         """Set date range in the date picker (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Only navigate if we're not already on the mentions page
         current_url = self.page.url
         if 'mentions' not in current_url.lower():
             logger.info(f"Navigating to mentions page for date range: {date_from} to {date_to}")
-            print(f"[INFO] Navigating to mentions page for date range: {date_from} to {date_to}")
-            await self.page.goto(self.MENTIONS_URL, wait_until='load', timeout=30000)
-            await asyncio.sleep(2)
+            await self._goto_async(self.MENTIONS_URL, self.MENTIONS_READY_SELECTOR)
         else:
             logger.debug("Already on mentions page, skipping navigation")
-            print(f"[DEBUG] Already on mentions page, skipping navigation")
         
         # Check if page is still open
         if self.page.is_closed():
@@ -663,207 +874,117 @@ class YouScanParser:
         
         # Find and click date picker
         logger.info("Looking for date picker...")
-        print("[INFO] Looking for date picker...")
         
-        # Step 1: Find the date picker input - try multiple strategies
+        # Step 1: Find the date picker input. Both strategies run in one in-page script that
+        # stops at the first hit, instead of a round-trip per strategy/element:
+        # 1. a visible text input inside a div[role="presentation"] container; the search
+        #    input (placeholder 'Пошук за текстом') is excluded by the selector itself
+        # 2. a text input in a container showing a date range like "2026-01-01 - 2026-01-02"
         date_input = None
-        
-        # Strategy 1: Find by role="presentation" container - skip search input
         try:
-            logger.info("Strategy 1: Looking for div[role='presentation']...")
-            print("[INFO] Strategy 1: Looking for div[role='presentation']...")
-            containers = await self.page.query_selector_all('div[role="presentation"]')
-            logger.info(f"Found {len(containers)} elements with role='presentation'")
-            print(f"[INFO] Found {len(containers)} elements with role='presentation'")
-            
-            for container in containers:
-                try:
-                    # Check if this container has an input inside
-                    inp = await container.query_selector('input[type="text"]')
-                    if inp:
-                        # Check if it's visible
-                        is_visible = await inp.is_visible()
-                        if not is_visible:
-                            continue
-                        
-                        # IMPORTANT: Skip the search input by checking placeholder
-                        placeholder = await inp.get_attribute('placeholder') or ''
-                        if placeholder == 'Пошук за текстом' or 'Пошук' in placeholder:
-                            logger.debug("Skipping search input (placeholder='Пошук за текстом')")
-                            print("[DEBUG] Skipping search input (placeholder='Пошук за текстом')")
-                            continue
-                        
-                        # This should be the date picker input
-                        value = await inp.get_attribute('value') or ''
-                        logger.info(f"Found potential date input, value: {value[:50]}, placeholder: {placeholder[:50]}")
-                        print(f"[INFO] Found potential date input, value: {value[:50]}, placeholder: {placeholder[:50]}")
-                        date_input = inp
-                        break
-                except Exception as e:
-                    logger.debug(f"Error checking container: {e}")
-                    continue
-        except Exception as e:
-            logger.debug(f"Strategy 1 failed: {e}")
-        
-        # Strategy 2: Find input by looking for date pattern in value or nearby text - skip search input
-        if not date_input:
-            try:
-                logger.info("Strategy 2: Looking for input with date pattern...")
-                print("[INFO] Strategy 2: Looking for input with date pattern...")
-                all_inputs = await self.page.query_selector_all('input[type="text"]')
-                logger.info(f"Found {len(all_inputs)} text inputs on page")
-                print(f"[INFO] Found {len(all_inputs)} text inputs on page")
+            handle = await self.page.evaluate_handle('''() => {
+                const isVisible = (el) => {
+                    const rect = el.getBoundingClientRect();
+                    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+                };
                 
-                for inp in all_inputs:
-                    try:
-                        is_visible = await inp.is_visible()
-                        if not is_visible:
-                            continue
-                        
-                        # IMPORTANT: Skip the search input by checking placeholder
-                        placeholder = await inp.get_attribute('placeholder') or ''
-                        if placeholder == 'Пошук за текстом' or 'Пошук' in placeholder:
-                            logger.debug("Skipping search input in Strategy 2")
-                            continue
-                        
-                        # Get value and check parent
-                        value = await inp.get_attribute('value') or ''
-                        # Check if parent has role="presentation"
-                        parent_has_role = await inp.evaluate('''el => {
-                            const parent = el.closest('div[role="presentation"]');
-                            return parent !== null;
-                        }''')
-                        
-                        # Check if value looks like a date (contains digits and dashes/slashes)
-                        looks_like_date = any(c.isdigit() for c in value) and ('-' in value or '/' in value or len(value) > 8)
-                        
-                        logger.debug(f"Input value: '{value[:50]}', placeholder: '{placeholder[:50]}', parent has role: {parent_has_role}, looks like date: {looks_like_date}")
-                        
-                        if parent_has_role and (looks_like_date or '202' in value or len(value) > 0):
-                            date_input = inp
-                            logger.info(f"Found potential date input with value: {value[:50]}")
-                            print(f"[INFO] Found potential date input with value: {value[:50]}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Error checking input: {e}")
-                        continue
-            except Exception as e:
-                logger.debug(f"Strategy 2 failed: {e}")
-        
-        # Strategy 3: Find by clicking on element that shows date text
-        if not date_input:
-            try:
-                logger.info("Strategy 3: Looking for element showing date text...")
-                print("[INFO] Strategy 3: Looking for element showing date text...")
-                # Look for text that contains date pattern like "2026-01-01 - 2026-01-02"
-                date_text_pattern = f"{date_from.strftime('%Y-%m-%d')} - {date_to.strftime('%Y-%m-%d')}"
-                # Or look for any date-like text
-                elements_with_date = await self.page.query_selector_all('*')
-                for elem in elements_with_date[:50]:  # Limit to first 50 to avoid timeout
-                    try:
-                        text = await elem.inner_text()
-                        if text and ('2026' in text or '2025' in text) and ('-' in text or len(text) > 8):
-                            # Check if it's clickable and might be the date picker
-                            tag_name = await elem.evaluate('el => el.tagName.toLowerCase()')
-                            if tag_name in ['input', 'div', 'span', 'button']:
-                                # Try to find input nearby
-                                parent = await elem.evaluate_handle('el => el.closest("div[role=\\"presentation\\"]")')
-                                if parent:
-                                    inp = await parent.query_selector('input[type="text"]')
-                                    if inp:
-                                        date_input = inp
-                                        logger.info("Found date input near date text")
-                                        print("[INFO] Found date input near date text")
-                                        break
-                    except:
-                        continue
-            except Exception as e:
-                logger.debug(f"Strategy 3 failed: {e}")
+                // Strategy 1: visible non-search text input inside a container
+                for (const inp of document.querySelectorAll('div[role="presentation"] input[type="text"]:not([placeholder*="Пошук" i])')) {
+                    if (isVisible(inp)) return inp;
+                }
+                
+                // Strategy 2: container whose text looks like a date range
+                for (const container of document.querySelectorAll('div[role="presentation"]')) {
+                    const inp = container.querySelector('input[type="text"]');
+                    if (!inp) continue;
+                    const text = container.textContent || '';
+                    if (/20\\d\\d/.test(text) && (text.includes('-') || text.length > 8)) return inp;
+                }
+                return null;
+            }''')
+            date_input = handle.as_element()
+            if date_input:
+                value = await date_input.get_attribute('value') or ''
+                logger.info(f"Found date picker input, value: {value[:50]}")
+            else:
+                await handle.dispose()
+        except Exception as e:
+            logger.debug(f"Date picker lookup failed: {e}")
         
         if not date_input:
-            # Take screenshot for debugging
-            try:
-                screenshot_path = 'date_picker_not_found_debug.png'
-                await self.page.screenshot(path=screenshot_path)
-                logger.error(f"Could not find date picker input. Screenshot saved to {screenshot_path}")
-                print(f"[ERROR] Could not find date picker input. Screenshot saved to {screenshot_path}")
-            except:
-                pass
+            await self._debug_screenshot_async('date_picker_not_found_debug.png')
             logger.warning("Could not find date picker input - will try to parse without setting date range")
-            print("[WARNING] Could not find date picker input - will try to parse without setting date range")
-            await asyncio.sleep(2)
             return
         
-        # Step 2: Simple approach - clear input, type date range, press Enter
+        # Step 2: Simple approach - set the date range in the input, press Enter
         try:
             logger.info(f"Setting date range: {date_from} to {date_to}")
-            print(f"[INFO] Setting date range: {date_from} to {date_to}")
             
             # IMPORTANT: The website interprets dates in UTC, but the browser timezone is set to 'America/New_York'
             # This causes a -1 day offset. To compensate, we add 1 day to the dates before typing them.
             # When the website receives "2026-01-02", it interprets it as UTC, which becomes "2026-01-01" in the browser's timezone
-            from datetime import timedelta
             adjusted_date_from = date_from + timedelta(days=1)
             adjusted_date_to = date_to + timedelta(days=1)
             
             # Format date range as "YYYY-MM-DD - YYYY-MM-DD" (with timezone compensation)
             date_range_str = f"{adjusted_date_from.strftime('%Y-%m-%d')} - {adjusted_date_to.strftime('%Y-%m-%d')}"
-            logger.info(f"Typing date range (with +1 day timezone compensation): {date_range_str}")
-            print(f"[INFO] Typing date range (with +1 day timezone compensation): {date_range_str}")
-            
-            # Focus the input
-            await date_input.focus()
-            await asyncio.sleep(0.3)
-            
-            # Clear the input more thoroughly
-            # Method 1: Select all and delete
-            await date_input.click(click_count=3)  # Triple click to select all
-            await asyncio.sleep(0.2)
-            await date_input.press('Backspace')
-            await asyncio.sleep(0.2)
-            
-            # Method 2: Use JavaScript to clear value
-            await date_input.evaluate('el => { el.value = ""; el.dispatchEvent(new Event("input", { bubbles: true })); }')
-            await asyncio.sleep(0.3)
-            
-            # Method 3: Clear via keyboard (Ctrl+A, Delete)
-            await date_input.press('Control+a')
-            await asyncio.sleep(0.1)
-            await date_input.press('Delete')
-            await asyncio.sleep(0.2)
-            
-            # Verify input is clear - try multiple times if needed
-            for clear_attempt in range(3):
-                current_value = await date_input.input_value()
-                if not current_value or not current_value.strip():
-                    break
-                logger.debug(f"Input still has value after clearing (attempt {clear_attempt + 1}): '{current_value}', clearing again")
-                await date_input.evaluate('el => { el.value = ""; el.dispatchEvent(new Event("input", { bubbles: true })); el.dispatchEvent(new Event("change", { bubbles: true })); }')
-                await asyncio.sleep(0.3)
-                # Also try selecting all and deleting
-                await date_input.press('Control+a')
-                await asyncio.sleep(0.1)
-                await date_input.press('Delete')
-                await asyncio.sleep(0.2)
-            
-            # Type the date range
-            await date_input.type(date_range_str, delay=50)  # Small delay between keystrokes
-            await asyncio.sleep(0.5)
-            
-            # Verify the value was set correctly
-            final_value = await date_input.input_value()
-            logger.debug(f"Date input value after typing: '{final_value}'")
-            if date_range_str not in final_value:
+            logger.info(f"Setting date range (with +1 day timezone compensation): {date_range_str}")
+            
+            # fill() clears the input and sets the range in one protocol
+            # call, with the focus and input events a typed value would produce
+            await date_input.fill(date_range_str)
+            
+            # Verify the value was set correctly: wait on the condition in the page instead
+            # of reading the value back, so a picker that reformats late still passes
+            try:
+                await self.page.wait_for_function(
+                    "([el, value]) => el.value.includes(value)",
+                    arg=[date_input, date_range_str],
+                    timeout=2000,
+                )
+            except _PLAYWRIGHT_ERRORS:
+                final_value = await date_input.input_value()
                 logger.warning(f"Date range may not have been set correctly. Expected: '{date_range_str}', Got: '{final_value}'")
-                print(f"[WARNING] Date range may not have been set correctly. Expected: '{date_range_str}', Got: '{final_value}'")
             
             # Press Enter to apply
             logger.info("Pressing Enter to apply date range")
-            print("[INFO] Pressing Enter to apply date range")
+            previous_first_id = await self._get_first_entry_id_async()
+            previous_url = self.page.url
             await date_input.press('Enter')
             
-            # Wait for page to update after date change
-            await asyncio.sleep(3)
+            # Wait for page to update after date change: done once the URL changes to one carrying
+            # exactly the typed from=/to= pair, or the entry list re-renders, whichever actually
+            # happens first (the entry list alone never changes for an empty range or one starting
+            # with the same entry; a URL that already matched before Enter doesn't count)
+            typed_from = adjusted_date_from.strftime('%Y-%m-%d')
+            typed_to = adjusted_date_to.strftime('%Y-%m-%d')
+            
+            def _is_applied_url(url: str) -> bool:
+                if url == previous_url:
+                    return False
+                from_match = _FROM_RE.search(url)
+                to_match = _TO_RE.search(url)
+                return bool(from_match and to_match and from_match.group(1) == typed_from
+                            and to_match.group(1) == typed_to)
+            
+            url_task = asyncio.create_task(self.page.wait_for_url(_is_applied_url, timeout=10000))
+            entries_task = asyncio.create_task(self._wait_for_page_entries_async(previous_first_id))
+            applied = False
+            pending = {url_task, entries_task}
+            while pending and not applied:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is entries_task:
+                        applied = applied or task.result()
+                    elif task.exception():
+                        logger.debug(f"URL did not show the new date range: {task.exception()}")
+                    else:
+                        applied = True
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if not applied:
+                logger.warning("Date range change was not confirmed by the URL or the entry list")
             
             # Verify the date range was applied by checking URL or page content
             current_url = self.page.url
@@ -873,8 +994,8 @@ class YouScanParser:
             # Note: We compare against the original dates (not adjusted), because the website
             # should display the dates we want, even if we had to add 1 day to compensate for timezone
             if 'from=' in current_url and 'to=' in current_url:
-                from_match = re.search(r'from=(\d{4}-\d{2}-\d{2})', current_url)
-                to_match = re.search(r'to=(\d{4}-\d{2}-\d{2})', current_url)
+                from_match = _FROM_RE.search(current_url)
+                to_match = _TO_RE.search(current_url)
                 if from_match and to_match:
                     url_from = from_match.group(1)
                     url_to = to_match.group(1)
@@ -882,46 +1003,46 @@ class YouScanParser:
                     expected_to = date_to.strftime('%Y-%m-%d')
                     if url_from == expected_from and url_to == expected_to:
                         logger.info(f"Date range verified in URL: {url_from} to {url_to}")
-                        print(f"[INFO] Date range verified in URL: {url_from} to {url_to}")
                     else:
                         logger.warning(f"Date range mismatch! Expected: {expected_from} to {expected_to}, Got in URL: {url_from} to {url_to}")
-                        print(f"[WARNING] Date range mismatch! Expected: {expected_from} to {expected_to}, Got in URL: {url_from} to {url_to}")
                         logger.info(f"Note: We typed {date_range_str} to compensate for timezone offset")
-                        print(f"[INFO] Note: We typed {date_range_str} to compensate for timezone offset")
             
             logger.info("Date range set successfully")
-            print("[INFO] Date range set successfully")
             
         except Exception as e:
-            logger.error(f"Error setting date range: {e}")
-            print(f"[ERROR] Error setting date range: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error setting date range: {e}")
             # Try to continue anyway
-            await asyncio.sleep(2)
-        
-        # Wait for page to update after date change
-        await asyncio.sleep(2)
     
     async def parse_all_entries_async(self, target_date: date) -> List[ParsedEntry]:
         """Parse all entries for a given date (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
+        # Website shows newest first, but we want oldest first in the table (chronological
+        # order): prepending each entry as it arrives builds that order without a final reverse
+        entries = deque()
+        async for entry in self.iter_entries_async(target_date):
+            entries.appendleft(entry)
         
-        entries = []
+        logger.info(f"Finished parsing: {len(entries)} total entries")
+        
+        return list(entries)
+    
+    async def iter_entries_async(self, target_date: date) -> AsyncIterator[ParsedEntry]:
+        """Yield entries for a given date page by page, in website order (newest first).
+        
+        Entries of a page are yielded as soon as that page is parsed, so callers can
+        process them while later pages are still being fetched.
+        """
+        total = 0
         page_num = 1
         
         # Check if page is still open
         if self.page.is_closed():
             logger.error("Page was closed before parsing")
-            print("[ERROR] Page was closed before parsing")
-            return entries
+            return
         
         while True:
             # Check if page is still open before each operation
             if self.page.is_closed():
                 logger.warning(f"Page was closed during parsing at page {page_num}")
-                print(f"[WARNING] Page was closed during parsing at page {page_num}")
                 break
             
             # Navigate to page if needed
@@ -930,55 +1051,53 @@ class YouScanParser:
                     await self._go_to_page_async(page_num)
                 except Exception as e:
                     logger.error(f"Error navigating to page {page_num}: {e}")
-                    print(f"[ERROR] Error navigating to page {page_num}: {e}")
                     break
             
-            # Parse entries on current page
+            # Check for a next page while this page is parsed: the check is read-only, so
+            # its round-trip overlaps the parsing instead of following it
+            has_next_task = asyncio.create_task(self._has_next_page_async())
+            # The finally also covers a consumer that stops iterating (or calls aclose())
+            # at the yield below, so the task is never left pending
             try:
-                page_entries = await self._parse_page_entries_async(target_date)
-            except Exception as e:
-                logger.error(f"Error parsing page {page_num}: {e}")
-                print(f"[ERROR] Error parsing page {page_num}: {e}")
-                # If page was closed, break
-                if "closed" in str(e).lower() or "Target" in str(type(e).__name__):
+                # Parse entries on current page
+                try:
+                    page_entries = await self._parse_page_entries_with_retry_async(target_date)
+                except Exception as e:
+                    logger.error(f"Error parsing page {page_num}: {e}")
+                    # Stale-handle errors were already retried; re-parsing the same page
+                    # again would just loop, so stop here
                     break
-                continue
-            
-            if not page_entries:
-                logger.info(f"No entries found on page {page_num}, stopping")
-                print(f"[INFO] No entries found on page {page_num}, stopping")
-                break
-            
-            entries.extend(page_entries)
-            logger.info(f"Page {page_num}: Found {len(page_entries)} entries (total: {len(entries)})")
-            print(f"[INFO] Page {page_num}: Found {len(page_entries)} entries (total: {len(entries)})")
-            
-            # Check if there's a next page
-            try:
-                has_next = await self._has_next_page_async()
-                if not has_next:
-                    logger.info("No more pages, finished parsing")
-                    print("[INFO] No more pages, finished parsing")
+                
+                if not page_entries:
+                    logger.info(f"No entries found on page {page_num}, stopping")
                     break
-            except Exception as e:
-                logger.warning(f"Error checking for next page: {e}")
-                print(f"[WARNING] Error checking for next page: {e}")
-                break
+                
+                total += len(page_entries)
+                logger.info(f"Page {page_num}: Found {len(page_entries)} entries (total: {total})")
+                for entry in page_entries:
+                    yield entry
+                
+                # Check if there's a next page
+                try:
+                    has_next = await has_next_task
+                    if not has_next:
+                        logger.info("No more pages, finished parsing")
+                        break
+                except Exception as e:
+                    logger.warning(f"Error checking for next page: {e}")
+                    break
+            finally:
+                if not has_next_task.done():
+                    has_next_task.cancel()
+                elif not has_next_task.cancelled():
+                    has_next_task.exception()  # Mark a failure as retrieved when it was never awaited
             
             page_num += 1
-        
-        logger.info(f"Finished parsing: {len(entries)} total entries")
-        print(f"[INFO] Finished parsing: {len(entries)} total entries")
-        
-        # Reverse all entries to show oldest first (chronological order)
-        # Website shows newest first, but we want oldest first in the table
-        entries.reverse()
-        logger.debug(f"Reversed all entries: now showing oldest first (chronological order)")
-        
-        return entries
     
     async def _go_to_page_async(self, page_num: int):
         """Navigate to a specific page (async version)."""
+        # Remember the current first entry so we can tell when the next page has rendered
+        previous_first_id = await self._get_first_entry_id_async()
         try:
             # Find pagination and click page number
             page_button = await self.page.wait_for_selector(
@@ -987,44 +1106,91 @@ class YouScanParser:
             )
             if page_button:
                 await page_button.click()
-                await self.page.wait_for_load_state('networkidle')
-                await asyncio.sleep(2)
-        except:
+                await self._wait_for_page_entries_async(previous_first_id)
+        except _PLAYWRIGHT_ERRORS:
             # Try clicking next button multiple times
+            next_button = self._get_next_button_locator()
             for _ in range(page_num - 1):
-                next_button = await self.page.query_selector('button:has-text(">"), a:has-text(">"), [aria-label*="next"]')
-                if next_button:
+                if await next_button.count():
                     await next_button.click()
-                    await asyncio.sleep(2)
+                    await self._wait_for_page_entries_async(previous_first_id)
+                    previous_first_id = await self._get_first_entry_id_async()
                 else:
                     break
     
+    async def _get_first_entry_id_async(self) -> Optional[str]:
+        """Get the ID of the first numeric-ID entry block on the page (async version)."""
+        return await self.page.evaluate("""
+            () => {
+                const first = Array.from(document.querySelectorAll('div[id]')).find(d => /^\\d{6,}$/.test(d.id));
+                return first ? first.id : null;
+            }
+        """)
+    
+    async def _wait_for_page_entries_async(self, previous_first_id: Optional[str] = None) -> bool:
+        """Wait until entry blocks are rendered and differ from the previous page (async version).
+        
+        Waiting for the entries themselves returns as soon as the data is visible, instead of
+        waiting for the network to go idle (analytics beacons keep SPA dashboards busy).
+        Returns False if they did not change within the timeout.
+        """
+        try:
+            await self.page.wait_for_function("""
+                (previousFirstId) => {
+                    const first = Array.from(document.querySelectorAll('div[id]')).find(d => /^\\d{6,}$/.test(d.id));
+                    return !!first && first.id !== previousFirstId;
+                }
+            """, arg=previous_first_id, timeout=10000)
+            return True
+        except PlaywrightError as e:
+            logger.debug(f"Entries did not change after pagination: {e}")
+            return False
+    
+    def _get_next_button_locator(self):
+        """Get the next-page button locator, built once per page.
+        
+        Locators are lazy and re-resolve against the current DOM on every use, so the
+        cached one stays valid across pagination; only its selector parsing is reused.
+        """
+        if self._next_btn_locator is None:
+            self._next_btn_locator = self.page.locator(
+                'button:has-text(">"), a:has-text(">"), [aria-label*="next"]'
+            ).first
+        return self._next_btn_locator
+    
     async def _has_next_page_async(self) -> bool:
         """Check if there's a next page (async version)."""
         try:
-            next_button = await self.page.query_selector(
-                'button:has-text(">"), a:has-text(">"), [aria-label*="next"]'
+            next_button = self._get_next_button_locator()
+            # Presence and disabled state in one round-trip; evaluate_all doesn't wait for
+            # a missing button. hasAttribute also catches disabled="" (a falsy string)
+            disabled_states = await next_button.evaluate_all(
+                "btns => btns.map(btn => btn.hasAttribute('disabled') || (btn.getAttribute('class') || '').includes('disabled'))"
             )
-            if next_button:
-                # Check if button is disabled
-                disabled = await next_button.get_attribute('disabled')
-                class_attr = await next_button.get_attribute('class') or ''
-                return not bool(disabled) and 'disabled' not in class_attr
-            return False
-        except:
+            return bool(disabled_states) and not disabled_states[0]
+        except _PLAYWRIGHT_ERRORS:
             return False
     
+    async def _parse_page_entries_with_retry_async(self, target_date: date, retries: int = 2) -> List[ParsedEntry]:
+        """Parse the current page, re-discovering entries if their handles go stale (async version)."""
+        for attempt in range(retries):
+            try:
+                return await self._parse_page_entries_async(target_date)
+            except PlaywrightError as e:
+                if self.page.is_closed() or not _is_stale_handle_error(e):
+                    raise
+                logger.warning(f"Entry handles went stale ({e}), re-fetching entries (attempt {attempt + 2}/{retries + 1})")
+        # Final attempt: any error propagates
+        return await self._parse_page_entries_async(target_date)
+    
     async def _parse_page_entries_async(self, target_date: date) -> List[ParsedEntry]:
         """Parse all entries on the current page (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         entries = []
+        self._page_desc_cache.clear()
         
         # Check if page is still open
         if self.page.is_closed():
             logger.error("Page was closed while parsing")
-            print("[ERROR] Page was closed while parsing")
             return entries
         
         # Find all entry containers
@@ -1036,259 +1202,161 @@ class YouScanParser:
         # This is more reliable than CSS selectors for dynamic numeric IDs
         try:
             logger.debug("Trying to find entries by numeric ID pattern")
-            # Find all divs with IDs that are purely numeric (6+ digits)
-            # Use JavaScript to get element IDs, then query by those IDs
-            numeric_ids = await self.page.evaluate("""
-                () => {
-                    const allDivs = document.querySelectorAll('div[id]');
-                    const entryIds = [];
-                    for (const div of allDivs) {
-                        const id = div.getAttribute('id');
-                        // Check if ID is numeric and at least 6 digits (typical for YouScan entry IDs like 777553656)
-                        if (id && /^\\d{6,}$/.test(id)) {
-                            // Check if this div has the structure of an entry block
-                            // Look for: profile images, social network indicators, date links, or substantial text
-                            const hasProfileImg = div.querySelector('img[src*="api/image/get"], img[src*="profile"], img[src*="avatar"]');
-                            const hasSocialNetwork = div.querySelector('span[title*="facebook"], span[title*="instagram"], a[href*="facebook"], a[href*="instagram"]');
-                            const hasDateLink = div.querySelector('a[href*="facebook.com"], a[href*="instagram.com"]');
-                            const hasSubstantialText = div.textContent.trim().length > 100;
-                            
-                            // Must have at least one of these indicators
-                            if (hasProfileImg || hasSocialNetwork || hasDateLink || hasSubstantialText) {
-                                entryIds.push(id);
-                            }
-                        }
-                    }
-                    return entryIds;
-                }
-            """)
-            
-            if numeric_ids and len(numeric_ids) > 0:
-                logger.info(f"Found {len(numeric_ids)} entries with numeric IDs: {numeric_ids[:5]}...")
-                print(f"[INFO] Found {len(numeric_ids)} entries with numeric IDs")
-                
-                # Use the more reliable method: Query all divs with IDs and filter by numeric_ids
-                # IMPORTANT: Get elements in DOM order to preserve visual order from page
+            # Find all divs with IDs that are purely numeric (6+ digits) and return the
+            # elements themselves (in DOM order) rather than their IDs, so Python does not
+            # have to locate them again; get_properties() unpacks the array in one round-trip.
+            # window.__bclFindEntries is injected once per context in start_async(); the full
+            # source is only sent if the helper is missing (null), not when it finds no entries
+            properties = {}
+            for script in ("() => window.__bclFindEntries ? window.__bclFindEntries() : null", self.FIND_ENTRIES_JS):
+                entries_handle = await self.page.evaluate_handle(script)
                 try:
-                    # Get all entry divs in DOM order using JavaScript
-                    # This ensures entries are in the same order as they appear visually on the page
-                    entry_ids_ordered = await self.page.evaluate("""
-                        (numericIds) => {
-                            const numericIdsSet = new Set(numericIds);
-                            const allDivs = Array.from(document.querySelectorAll('div[id]'));
-                            const entryIds = [];
-                            
-                            // Collect IDs in DOM order (as they appear on page)
-                            for (const div of allDivs) {
-                                const id = div.getAttribute('id');
-                                if (id && numericIdsSet.has(id)) {
-                                    entryIds.push(id);
-                                }
-                            }
-                            
-                            return entryIds;
-                        }
-                    """, numeric_ids)
-                    
-                    # Now query elements in the correct DOM order
-                    for entry_id in entry_ids_ordered:
-                        try:
-                            elem = await self.page.query_selector(f'div[id="{entry_id}"]')
-                            if elem:
-                                entry_elements.append(elem)
-                        except:
-                            continue
-                    
-                    # Fallback: if JavaScript approach didn't work, use original method
-                    if not entry_elements:
-                        all_divs_with_ids = await self.page.query_selector_all('div[id]')
-                        logger.debug(f"Found {len(all_divs_with_ids)} divs with id attribute")
-                        numeric_ids_set = set(numeric_ids)
-                        
-                        for div in all_divs_with_ids:
-                            try:
-                                div_id = await div.get_attribute('id')
-                                if div_id and div_id in numeric_ids_set:
-                                    entry_elements.append(div)
-                            except:
-                                continue
-                    
-                    if entry_elements:
-                        logger.info(f"Retrieved {len(entry_elements)} entries using bulk query method (in DOM order)")
-                        print(f"[INFO] Retrieved {len(entry_elements)} entries using bulk query method (in DOM order)")
-                    else:
-                        logger.warning(f"Found {len(numeric_ids)} numeric IDs but couldn't retrieve any elements")
-                        print(f"[WARNING] Found {len(numeric_ids)} numeric IDs but couldn't retrieve any elements")
-                except Exception as bulk_error:
-                    logger.debug(f"Bulk query method failed: {bulk_error}, trying individual queries in DOM order")
-                    # Fallback: Try individual queries, but get them in DOM order
-                    try:
-                        # Get IDs in DOM order first
-                        entry_ids_ordered = await self.page.evaluate("""
-                            (numericIds) => {
-                                const numericIdsSet = new Set(numericIds);
-                                const allDivs = Array.from(document.querySelectorAll('div[id]'));
-                                const entryIds = [];
-                                
-                                // Collect IDs in DOM order (as they appear on page)
-                                for (const div of allDivs) {
-                                    const id = div.getAttribute('id');
-                                    if (id && numericIdsSet.has(id)) {
-                                        entryIds.push(id);
-                                    }
-                                }
-                                
-                                return entryIds;
-                            }
-                        """, numeric_ids)
-                        
-                        # Query elements in DOM order
-                        for entry_id in entry_ids_ordered:
-                            try:
-                                elem = await self.page.query_selector(f'div[id="{entry_id}"]')
-                                if elem:
-                                    entry_elements.append(elem)
-                            except Exception as e:
-                                logger.debug(f"Error getting element with ID {entry_id}: {e}")
-                                continue
-                    except:
-                        # Final fallback: query in original order
-                        for entry_id in numeric_ids:
-                            try:
-                                elem = await self.page.query_selector(f'div[id="{entry_id}"]')
-                                if elem:
-                                    entry_elements.append(elem)
-                            except Exception as e:
-                                logger.debug(f"Error getting element with ID {entry_id}: {e}")
-                                continue
-                    
-                    if entry_elements:
-                        logger.info(f"Retrieved {len(entry_elements)} valid entry elements using individual queries (in DOM order)")
-                        print(f"[INFO] Retrieved {len(entry_elements)} valid entry elements using individual queries (in DOM order)")
+                    properties = await entries_handle.get_properties()
+                    # An empty result is only re-checked when there are no properties to tell
+                    # a real empty array from a missing helper
+                    helper_missing = not properties and await entries_handle.json_value() is None
+                finally:
+                    await entries_handle.dispose()
+                if not helper_missing:
+                    break
+            for prop in properties.values():
+                elem = prop.as_element()
+                if elem:
+                    entry_elements.append(elem)
+            
+            if entry_elements:
+                logger.info(f"Found {len(entry_elements)} entries with numeric IDs (in DOM order)")
         except Exception as e:
-            logger.debug(f"JavaScript-based entry finding failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug(f"JavaScript-based entry finding failed: {e}", exc_info=True)
         
         # Final fallback: Try CSS selectors if JavaScript approach didn't work
         if not entry_elements:
-            entry_selectors = [
-                'div[id^="7"]',  # IDs starting with 7
-                'div[id^="8"]',  # IDs starting with 8
-                'div[id^="9"]',  # IDs starting with 9
-                '[class*="mention"]',
-                '[class*="Mention"]',
-                '[class*="post"]',
-                '[class*="entry"]',
-                '[class*="item"]',
-                'article',
-                '[data-testid*="mention"]',
-                '[role="article"]',
-                'div[class*="card"]',
-                'div[class*="Card"]',
-            ]
-            
-            for selector in entry_selectors:
+            # ENTRY_SELECTORS are matched in one evaluate and one DOM walk (the selectors joined
+            # into a single querySelectorAll); the matches are then filtered selector by selector,
+            # in order, and the first selector with matches that pass its filter wins
+            try:
+                logger.debug("Trying CSS fallback entry selectors")
+                entries_handle = await self.page.evaluate_handle("""
+                    (selectors) => {
+                        const NUMERIC_ID_RE = /^\\d{6,}$/;
+                        const matched = Array.from(document.querySelectorAll(selectors.join(', ')));
+                        // SVG elements have no innerText; text length is only read for
+                        // selectors that are actually reached, once per element
+                        const textLengths = new Map();
+                        const textLength = (elem) => {
+                            if (!textLengths.has(elem)) {
+                                textLengths.set(elem, (elem.innerText ?? elem.textContent ?? '').trim().length);
+                            }
+                            return textLengths.get(elem);
+                        };
+                        for (const selector of selectors) {
+                            // For ID-based selectors, verify they have numeric IDs;
+                            // for other selectors, check if they look like entries (substantial content)
+                            const idBased = selector.includes('id');
+                            const filtered = matched.filter(elem => elem.matches(selector) && (idBased
+                                ? NUMERIC_ID_RE.test(elem.id)
+                                : textLength(elem) > 50));
+                            if (filtered.length > 0) return filtered;
+                        }
+                        return [];
+                    }
+                """, list(self.ENTRY_SELECTORS))
                 try:
-                    logger.debug(f"Trying entry selector: {selector}")
-                    elements = await self.page.query_selector_all(selector)
-                    if elements and len(elements) > 0:
-                        # For ID-based selectors, verify they have numeric IDs
-                        if 'id' in selector:
-                            filtered = []
-                            for elem in elements:
-                                try:
-                                    elem_id = await elem.get_attribute('id')
-                                    if elem_id and elem_id.isdigit() and len(elem_id) >= 6:
-                                        filtered.append(elem)
-                                except:
-                                    continue
-                            if filtered:
-                                logger.info(f"Found {len(filtered)} elements with selector: {selector}")
-                                print(f"[INFO] Found {len(filtered)} elements with selector: {selector}")
-                                entry_elements = filtered
-                                break
-                        else:
-                            # For other selectors, check if they look like entries
-                            # Filter by having substantial content
-                            filtered = []
-                            for elem in elements:
-                                try:
-                                    text = await elem.inner_text()
-                                    if text and len(text.strip()) > 50:  # Has substantial content
-                                        filtered.append(elem)
-                                except:
-                                    continue
-                            if filtered:
-                                logger.info(f"Found {len(filtered)} elements with selector: {selector}")
-                                print(f"[INFO] Found {len(filtered)} elements with selector: {selector}")
-                                entry_elements = filtered
-                                break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+                    properties = await entries_handle.get_properties()
+                finally:
+                    await entries_handle.dispose()
+                for prop in properties.values():
+                    elem = prop.as_element()
+                    if elem:
+                        entry_elements.append(elem)
+                if entry_elements:
+                    logger.info(f"Found {len(entry_elements)} elements with CSS fallback selectors")
+            except Exception as e:
+                logger.debug(f"CSS fallback entry selectors failed: {e}")
         
         if not entry_elements:
             logger.warning("No entry elements found on page")
-            print("[WARNING] No entry elements found on page")
-            # Take screenshot for debugging
-            try:
-                screenshot_path = f'no_entries_debug_{target_date}.png'
-                await self.page.screenshot(path=screenshot_path)
-                logger.info(f"Screenshot saved to {screenshot_path}")
-                print(f"[DEBUG] Screenshot saved to {screenshot_path}")
-            except:
-                pass
+            # Take a debugging screenshot only on the first miss of the session;
+            # each one costs a full page paint
+            if not self._screenshot_taken:
+                self._screenshot_taken = True
+                await self._debug_screenshot_async(f'no_entries_debug_{target_date}.png')
         
-        for idx, entry_elem in enumerate(entry_elements):
+        # Read the fields (tag spans included) of every entry in one round-trip; each entry
+        # then only needs the browser for the username modal. On failure, entries read their own
+        fields_list = [None] * len(entry_elements)
+        if entry_elements:
             try:
-                logger.debug(f"Parsing entry {idx + 1}/{len(entry_elements)}")
-                entry = await self._parse_single_entry_async(entry_elem, target_date)
-                if entry:
-                    entries.append(entry)
-                    logger.debug(f"Successfully parsed entry {idx + 1}")
-            except Exception as e:
-                logger.warning(f"Error parsing entry {idx + 1}: {e}")
-                print(f"[WARNING] Error parsing entry {idx + 1}: {e}")
-                continue
+                fields_list = await self.page.evaluate(
+                    self.ENTRY_FIELDS_BATCH_JS, [entry_elements, self.ENTRY_FIELDS_ARG]
+                )
+            except _PLAYWRIGHT_ERRORS as e:
+                if _is_stale_handle_error(e):
+                    raise
+                logger.debug(f"Batched entry field read failed: {e}")
+        
+        # Parse entries concurrently so their CDP round-trips overlap; the semaphore
+        # caps in-flight traffic to the browser. gather() keeps results in DOM order.
+        semaphore = asyncio.Semaphore(self.ENTRY_CONCURRENCY)
+        
+        async def _parse_guarded(entry_elem, fields):
+            async with semaphore:
+                return await self._parse_single_entry_async(entry_elem, target_date, fields)
+        
+        results = await asyncio.gather(
+            *[_parse_guarded(entry_elem, fields) for entry_elem, fields in zip(entry_elements, fields_list)],
+            return_exceptions=True
+        )
+        for idx, result in enumerate(results):
+            if _is_stale_handle_error(result):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning(f"Error parsing entry {idx + 1}: {result}")
+            elif result:
+                entries.append(result)
+                logger.debug(f"Successfully parsed entry {idx + 1}")
         
         logger.info(f"Parsed {len(entries)} entries from {len(entry_elements)} elements")
-        print(f"[INFO] Parsed {len(entries)} entries from {len(entry_elements)} elements")
         
         return entries
     
-    async def _parse_single_entry_async(self, entry_elem, target_date: date) -> Optional[ParsedEntry]:
-        """Parse a single entry element (async version)."""
-        import logging
-        from datetime import datetime
-        logger = logging.getLogger(__name__)
+    async def _parse_single_entry_async(self, entry_elem, target_date: date,
+                                        fields: Optional[Dict] = None) -> Optional[ParsedEntry]:
+        """Parse a single entry element (async version).
+        
+        Args:
+            entry_elem: Entry element handle
+            target_date: Date to keep entries for
+            fields: ENTRY_FIELDS_JS result when already read for the whole page
+        """
+        # Read date text, name, links, social span, note sources and tag spans in one round-trip
+        try:
+            if fields is None:
+                fields = await entry_elem.evaluate(
+                    self.ENTRY_FIELDS_JS, self.ENTRY_FIELDS_ARG
+                )
+        except _PLAYWRIGHT_ERRORS as e:
+            if _is_stale_handle_error(e):
+                raise
+            logger.debug(f"Could not read entry fields: {e}")
+            fields = {'dateText': None, 'name': '', 'authorLink': None, 'link': None, 'socialText': None, 'fullText': None,
+                      'noteActionText': None, 'noteParts': []}
         
         # First, extract the actual date from the entry to filter by target_date
         entry_date = None
         try:
-            # Look for date link: <a href="..." class="j0EW2HMfFh3MvBbwygOB">2 січня 2026 р., 14:37</a>
-            date_link = await entry_elem.query_selector('a.j0EW2HMfFh3MvBbwygOB, a[href*="facebook"], a[href*="instagram"]')
-            if date_link:
-                date_text = await date_link.inner_text()
+            # Date link: <a href="..." class="j0EW2HMfFh3MvBbwygOB">2 січня 2026 р., 14:37</a>
+            date_text = fields['dateText']
+            if date_text:
                 # Parse Ukrainian date format: "2 січня 2026 р., 14:37" or "2 января 2026 г., 14:37"
-                # Map Ukrainian/Russian month names to numbers
-                month_map = {
-                    'січня': 1, 'лютого': 2, 'березня': 3, 'квітня': 4, 'травня': 5, 'червня': 6,
-                    'липня': 7, 'серпня': 8, 'вересня': 9, 'жовтня': 10, 'листопада': 11, 'грудня': 12,
-                    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4, 'мая': 5, 'июня': 6,
-                    'июля': 7, 'августа': 8, 'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12,
-                }
-                
                 # Try to parse date from text like "2 січня 2026 р., 14:37"
-                date_match = re.search(r'(\d{1,2})\s+([а-яіїєґ]+)\s+(\d{4})', date_text, re.IGNORECASE)
+                date_match = _ENTRY_DATE_RE.search(date_text)
                 if date_match:
                     day = int(date_match.group(1))
-                    month_name = date_match.group(2).lower()
+                    month = _MONTH_MAP[date_match.group(2).lower()]
                     year = int(date_match.group(3))
-                    month = month_map.get(month_name)
-                    if month:
-                        entry_date = date(year, month, day)
-                        logger.debug(f"Extracted entry date: {entry_date} from text: '{date_text}'")
+                    entry_date = date(year, month, day)
+                    logger.debug(f"Extracted entry date: {entry_date} from text: '{date_text}'")
         except Exception as e:
             logger.debug(f"Could not extract date from entry: {e}")
         
@@ -1303,38 +1371,24 @@ class YouScanParser:
         try:
             # 1. Parse user name (Назва)
             # Structure: <span class="NR97fosTp2Dtw_WKVPAN zFP66ww7zDIL4Gc2auF8">Тетяна Ломакіна</span>
-            # This appears in the author section at the top
-            name_selectors = [
-                'span.NR97fosTp2Dtw_WKVPAN',  # Specific class for author name
-                'span[class*="NR97fosTp2Dtw"]',  # Partial match
-                'div[class*="e99EkRyEQ2YU1HjaKz7j"] span',  # Author section
-            ]
-            
-            name_text = ''
-            name_elem = None  # Store the element for clicking later
-            for selector in name_selectors:
-                try:
-                    name_elem = await entry_elem.query_selector(selector)
-                    if name_elem:
-                        name_text = (await name_elem.inner_text()).strip()
-                        # Get the first span with actual name (skip empty ones)
-                        if name_text and len(name_text) > 2:
-                            break
-                except:
-                    continue
+            # This appears in the author section at the top (read by ENTRY_FIELDS_JS)
+            name_text = fields['name']
+            name_elem = None  # Element for clicking later; looked up by _parse_user_description_async if unset
+            entry_text = fields['fullText']  # Full entry text (if fetched), shared by the fallbacks below
             
             # If not found, try to extract from the full text structure
             if not name_text or len(name_text) < 2:
                 try:
                     # Look for pattern like "Тетяна Ломакіна відповіла на коментар"
-                    full_text = await entry_elem.inner_text()
-                    match = re.search(r'^([А-ЯІЇЄҐа-яіїєґ\s]+?)\s+(відповіла|відповів|залишив|поділив)', full_text)
+                    if entry_text is None:
+                        entry_text = await entry_elem.inner_text()
+                    match = _NAME_ACTION_RE.search(entry_text)
                     if match:
                         name_text = match.group(1).strip()
                         # Try to find the element again with the matched text
                         if name_text:
                             name_elem = await entry_elem.query_selector(f'span:has-text("{name_text}")')
-                except:
+                except _PLAYWRIGHT_ERRORS:
                     pass
             
             entry.name = name_text if name_text else 'Невідомий користувач'
@@ -1342,134 +1396,107 @@ class YouScanParser:
             # 2. Parse social network link and name
             # Structure: <a href="https://www.facebook.com/..." class="j0EW2HMfFh3MvBbwygOB">2 січня 2026 р., 14:37</a>
             # The date link contains the actual post URL
-            link_elem = await entry_elem.query_selector('a.j0EW2HMfFh3MvBbwygOB, a[href*="facebook"], a[href*="instagram"], a[href*="twitter"], a[href*="linkedin"], a[href*="youtube"], a[href*="t.me"], a[href*="telegram.me"], a[href*="telegram"], a[href*="tiktok"], a[href*="threads"], a[href*="soundcloud"]')
+            link_href = fields['link']
             
-            if link_elem:
-                link_href = await link_elem.get_attribute('href') or ''
+            if link_href is not None:
                 entry.link = link_href
-                entry.social_network = detect_social_network_from_link(link_href)
+                entry.social_network, entry.table_name = detect_social_network_and_table(link_href, entry.date)
                 logger.debug(f"Found link: {link_href}, social network: {entry.social_network}")
-                print(f"[LINK] Found link: {link_href}, social network: {entry.social_network}")
             else:
                 # Fallback: Look for social network name in span
                 # Structure: <span class="FnMtmUa9bs__3sxIz_4N BgNMJrrsKXup73BhMooc">facebook.com</span>
                 # Or: <span class="FnMtmUa9bs__3sxIz_4N BgNMJrrsKXup73BhMooc">telegram.me</span>
-                social_span = await entry_elem.query_selector('span.FnMtmUa9bs__3sxIz_4N, span[class*="FnMtmUa9bs"]')
-                if social_span:
-                    social_text = (await social_span.inner_text()).strip()
-                    if social_text:
-                        # Clean up the text (remove any extra whitespace)
-                        social_text = social_text.strip()
-                        entry.social_network = detect_social_network_from_link(f"https://{social_text}")
-                        logger.info(f"Found social network from span: {social_text}, detected: {entry.social_network}")
-                        print(f"[LINK] Found social network from span: '{social_text}', detected: {entry.social_network}")
+                social_text = (fields['socialText'] or '').strip()
+                if social_text:
+                    entry.social_network = detect_social_network_from_link(f"https://{social_text}")
+                    logger.info(f"Found social network from span: {social_text}, detected: {entry.social_network}")
                 
                 # Additional fallback: Search for social network names in entry text
                 if not entry.social_network:
-                    entry_text = await entry_elem.inner_text()
+                    if entry_text is None:
+                        entry_text = await entry_elem.inner_text()
                     entry_text_lower = entry_text.lower()
                     # Check for Telegram (both t.me and telegram.me)
                     if 't.me' in entry_text_lower or 'telegram.me' in entry_text_lower or 'telegram' in entry_text_lower:
                         entry.social_network = 'Telegram'
                         logger.info(f"Detected Telegram from entry text")
-                        print(f"[LINK] Detected Telegram from entry text")
             
-            # 3. Get link via share button (if not found above)
+            # 3. Get link from any other social network anchor in the entry (if not found above);
+            # ENTRY_FIELDS_JS already looked for it unless the fields read failed
             if not entry.link:
-                entry.link = await self._get_link_via_share_button_async(entry_elem)
+                anchor_link = fields.get('anchorLink')
+                entry.link = anchor_link if anchor_link is not None else await self._get_link_from_anchors_async(entry_elem)
                 if entry.link:
-                    entry.social_network = detect_social_network_from_link(entry.link)
+                    entry.social_network, entry.table_name = detect_social_network_and_table(entry.link, entry.date)
             
             # 4. Parse tags (Тема) - get first one
-            tags = await self._parse_tags_async(entry_elem)
+            tags = await self._parse_tags_async(entry_elem, fields.get('tagSpans'))
             entry.tag = tags[0] if tags else ''
             
             # 5. Parse note (Примітки) - main text content
             # Structure: <p class="VqFKkdgOknQMdibReX6Y"> and <span class="Q73iQ9Oh3QBkbjh10U6t WJIiADpYvnCJ14uuC16a">
-            entry.note = await self._parse_note_async(entry_elem)
+            entry.note = self._build_note(fields['noteActionText'], fields['noteParts'])
             
             # 6. Parse user description (Хто це) - click on username
-            entry.description = await self._parse_user_description_async(entry_elem, name_elem)
-            
-            # 7. Determine table name based on entry (year-based)
-            entry.table_name = detect_table_from_entry(entry)
+            # The same user often appears in several entries, so descriptions are cached: by
+            # author profile link for the session, or by name for the current page only when
+            # there is no link, since display names are not unique (checked again under the
+            # lock, in case a concurrent entry just fetched it)
+            author_link = fields.get('authorLink')
+            if author_link:
+                desc_cache, cache_key = self._desc_cache, author_link
+            else:
+                desc_cache = self._page_desc_cache
+                cache_key = name_text if name_text and name_text != 'Невідомий користувач' else None
+            if cache_key in desc_cache:
+                entry.description = desc_cache[cache_key]
+            else:
+                async with self._interaction_lock:
+                    if cache_key in desc_cache:
+                        entry.description = desc_cache[cache_key]
+                    else:
+                        description = await self._parse_user_description_async(entry_elem, name_elem)
+                        entry.description = description or ''
+                        # None means the modal was not read; the next entry by this author retries
+                        if cache_key and description is not None:
+                            desc_cache[cache_key] = description
+            
+            # 7. Determine table name based on entry (year-based), unless the link lookup above already did
+            if not entry.table_name:
+                entry.table_name = detect_table_from_entry(entry)
             logger.debug(f"Determined table name: {entry.table_name} for entry date: {entry.date}")
-            print(f"[TABLE] Determined table name: {entry.table_name} for entry date: {entry.date}")
             
             return entry
             
         except Exception as e:
-            logger.error(f"Error parsing entry: {e}")
-            print(f"[ERROR] Error parsing entry: {e}")
-            import traceback
-            traceback.print_exc()
+            if _is_stale_handle_error(e):
+                raise  # Let the page-level retry re-discover the entries
+            logger.error(f"Error parsing entry: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
     
-    async def _get_link_via_share_button_async(self, entry_elem) -> str:
-        """Click share button and get link (async version)."""
+    async def _get_link_from_anchors_async(self, entry_elem) -> str:
+        """Get the post link from the entry's anchors (async version).
+        
+        Reads every <a href> of the entry in a single evaluate() call and returns the first
+        one pointing to a known social network, instead of clicking through the share dialog.
+        """
         try:
-            # Find share button (icon with share symbol)
-            share_selectors = [
-                'button[aria-label*="share"]',
-                'button[aria-label*="поділитися"]',
-                '[class*="share"]',
-                'button:has([class*="share"])',
-                'svg:has-text("share")',
-            ]
-            
-            share_button = None
-            for selector in share_selectors:
-                try:
-                    share_button = await entry_elem.query_selector(selector)
-                    if share_button:
-                        break
-                except:
-                    continue
-            
-            if not share_button:
-                return ''
-            
-            # Click share button
-            await share_button.click()
-            await asyncio.sleep(1)
-            
-            # Look for "Скопіювати посилання" button
-            copy_link_selectors = [
-                'button:has-text("Скопіювати посилання")',
-                'button:has-text("Copy link")',
-                '[class*="copy"]:has-text("посилання")',
-                '[class*="copy"]:has-text("link")',
-            ]
-            
-            copy_button = None
-            for selector in copy_link_selectors:
-                try:
-                    copy_button = await self.page.wait_for_selector(selector, timeout=2000)
-                    if copy_button:
-                        break
-                except:
-                    continue
-            
-            if copy_button:
-                await copy_button.click()
-                await asyncio.sleep(0.5)
-                # Link should be in clipboard, but we can try to get it from the dialog
-                # For now, we'll need to handle clipboard or get from dialog
-                # This is a simplified version - may need adjustment
-            
-            # Close share dialog if open
-            close_button = await self.page.query_selector('button[aria-label="Close"], button:has-text("×"), [class*="close"]')
-            if close_button:
-                await close_button.click()
-                await asyncio.sleep(0.5)
-            
-            # Return empty for now - clipboard access in async context needs special handling
-            return ''
-        except Exception as e:
-            print(f"Error getting link via share button: {e}")
+            return await entry_elem.evaluate("""
+                (el, domains) => {
+                    for (const anchor of el.querySelectorAll('a[href]')) {
+                        const href = anchor.href.toLowerCase();
+                        if (domains.some(domain => href.includes(domain))) {
+                            return anchor.href;
+                        }
+                    }
+                    return '';
+                }
+            """, SOCIAL_NETWORK_DOMAINS)
+        except _PLAYWRIGHT_ERRORS as e:
+            logger.debug(f"Error reading entry links: {e}")
             return ''
     
-    async def _parse_tags_async(self, entry_elem) -> List[str]:
+    async def _parse_tags_async(self, entry_elem, tag_texts: Optional[List[str]] = None) -> List[str]:
         """
         Parse tags from entry - match against dropdown options, or return original if no match (async version).
         
@@ -1490,417 +1517,178 @@ class YouScanParser:
             </div>
           </div>
         </div>
-        """
-        import logging
-        logger = logging.getLogger(__name__)
         
+        Args:
+            entry_elem: Entry element handle
+            tag_texts: TAG_SPANS_JS result when already read with the entry fields
+        """
         found_tags = []  # Store original tag text found in UI
         matched_tags = []  # Store matched dropdown options
+        found_seen = set()  # Mirrors found_tags for O(1) duplicate checks
+        matched_seen = set()  # Mirrors matched_tags for O(1) duplicate checks
         
-        # Strategy 1: Use JavaScript to find tags in ALL child divs of izj773vLNpCIfNBWnzoQ (except first one with "Стаття")
+        # Find tags in ALL child divs of izj773vLNpCIfNBWnzoQ (except first one with "Стаття") in one
+        # pass over the subtree; the tag div's own spans are the in-page fallback. Matching against
+        # the dropdown options happens below, on the precomputed lowercase option table
         # Based on actual HTML: structure is izj773vLNpCIfNBWnzoQ -> kUy1sArwGFcGCnoB7ZWg (Стаття) -> RynAcp3UczxMoGCp6Syp (separator) -> l9Xop4gL9H3TgNeRAp2A (tag)
         try:
-            tag_texts = await entry_elem.evaluate("""
-                (tagOptions) => {
-                    const found = [];
-                    // Find divs with class izj773vLNpCIfNBWnzoQ (stable container)
-                    const tagWrappers = this.querySelectorAll('div[class*="izj773vLNpCIfNBWnzoQ"]');
-                    for (const wrapper of tagWrappers) {
-                        // Get all direct child divs (not nested)
-                        const childDivs = Array.from(wrapper.children).filter(el => el.tagName === 'DIV');
-                        if (childDivs.length === 0) continue;
-                        
-                        // Check ALL child divs (skip first one which usually has "Стаття")
-                        // Start from index 1 to skip the first div
-                        for (let i = 1; i < childDivs.length; i++) {
-                            const childDiv = childDivs[i];
-                            
-                            // Skip empty separator divs (like RynAcp3UczxMoGCp6Syp)
-                            const divText = childDiv.textContent.trim();
-                            if (!divText || divText.length === 0) continue;
-                            
-                            // Check if this div contains "Стаття" - if so, skip it
-                            if (divText.includes('Стаття') && divText.length < 20) {
-                                continue; // Skip divs that only contain "Стаття"
-                            }
-                            
-                            // Find ALL spans in this div - don't rely on specific container classes
-                            const spans = childDiv.querySelectorAll('span');
-                            for (const span of spans) {
-                                const text = span.textContent.trim();
-                                
-                                // Skip empty, single chars, close icons, and "Стаття"
-                                if (!text || text === 'x' || text === 'X' || text === 'Стаття' || text.length < 2) continue;
-                                
-                                // Skip if it's inside a button (like "Додати тег")
-                                if (span.closest('button')) continue;
-                                
-                                // Skip if it's just an icon (has icon but no text)
-                                const hasIcon = span.querySelector('i.mdi');
-                                if (hasIcon) {
-                                    // Check if span has actual text content (not just icon)
-                                    const textNodes = Array.from(span.childNodes).filter(n => n.nodeType === 3 && n.textContent.trim());
-                                    if (textNodes.length === 0) continue;
-                                }
-                                
-                                // This looks like a tag - add it
-                                if (!found.includes(text)) {
-                                    found.push(text);
-                                }
-                            }
-                        }
-                    }
-                    return found;
-                }
-            """, TAG_OPTIONS)
+            if tag_texts is None:
+                tag_texts = await entry_elem.evaluate(self.TAG_SPANS_JS)
             
             if tag_texts and len(tag_texts) > 0:
                 for tag_text in tag_texts:
-                    if tag_text not in found_tags:
+                    if tag_text not in found_seen:
+                        found_seen.add(tag_text)
                         found_tags.append(tag_text)
                 logger.info(f"Found tags via JavaScript (last div method): {tag_texts}")
-                print(f"[TAG] Found tags via JavaScript: {tag_texts}")
-        except Exception as e:
-            logger.debug(f"JavaScript tag extraction failed: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        # Strategy 2: CSS selector approach - check ALL child divs (skip first one with "Стаття")
-        try:
-            # Find izj773vLNpCIfNBWnzoQ containers
-            tag_wrappers = await entry_elem.query_selector_all('div[class*="izj773vLNpCIfNBWnzoQ"]')
-            for wrapper in tag_wrappers:
-                try:
-                    # Get all direct child divs
-                    child_divs = await wrapper.query_selector_all(':scope > div')
-                    if child_divs and len(child_divs) > 0:
-                        # Check ALL child divs starting from index 1 (skip first one which has "Стаття")
-                        for i in range(1, len(child_divs)):
-                            child_div = child_divs[i]
-                            
-                            # Skip empty separator divs (like RynAcp3UczxMoGCp6Syp)
-                            div_text = (await child_div.inner_text()).strip()
-                            if not div_text or len(div_text) == 0:
-                                continue  # Skip empty separator divs
-                            
-                            # Check if this div contains "Стаття" - if so, skip it
-                            if 'Стаття' in div_text and len(div_text) < 20:
-                                continue  # Skip divs that only contain "Стаття"
-                            
-                            # Find ALL spans in this div - don't rely on specific container classes
-                            spans = await child_div.query_selector_all('span')
-                            for span in spans:
-                                tag_text = (await span.inner_text()).strip()
-                                # Skip "Стаття", empty, single chars, close icons
-                                if not tag_text or tag_text == 'Стаття' or tag_text in ['x', 'X'] or len(tag_text) < 2:
-                                    continue
-                                # Skip if it's inside a button
-                                try:
-                                    is_in_button = await span.evaluate('el => el.closest("button") !== null')
-                                    if is_in_button:
-                                        continue
-                                except:
-                                    pass
-                                # Skip if it's just an icon
-                                try:
-                                    has_icon = await span.query_selector('i.mdi')
-                                    if has_icon:
-                                        # Check if span has actual text content
-                                        text_content = await span.evaluate('el => Array.from(el.childNodes).filter(n => n.nodeType === 3 && n.textContent.trim()).length')
-                                        if text_content == 0:
-                                            continue
-                                except:
-                                    pass
-                                if tag_text not in found_tags:
-                                    found_tags.append(tag_text)
-                                    logger.info(f"Found tag in child div {i} (CSS method): {tag_text}")
-                                    print(f"[TAG] Found tag via CSS (div {i}): {tag_text}")
-                except Exception as e:
-                    logger.debug(f"Error extracting tag from wrapper: {e}")
-                    continue
-        except Exception as e:
-            logger.debug(f"CSS tag container extraction failed: {e}")
-        
-        # Strategy 3: Direct CSS selectors targeting the last div structure (additional check)
-        tag_selectors = [
-            'div[class*="izj773vLNpCIfNBWnzoQ"] > div:last-child span',  # Last child -> any span
-            'div[class*="l9Xop4gL9H3TgNeRAp2A"] span',  # Last div class -> any span
-        ]
-        
-        entry_text = await entry_elem.inner_text()
-        
-        # Try CSS selectors as additional check (always run, not just as fallback)
-        for selector in tag_selectors:
-            try:
-                tag_elements = await entry_elem.query_selector_all(selector)
-                for tag_elem in tag_elements:
-                    tag_text = (await tag_elem.inner_text()).strip()
-                    # Skip "Стаття", "Додати тег", empty, single chars
-                    if tag_text and tag_text != 'Стаття' and tag_text != 'Додати тег' and tag_text not in ['x', 'X'] and len(tag_text) > 1:
-                        # Skip if it's inside a button
-                        try:
-                            is_in_button = await tag_elem.evaluate('el => el.closest("button") !== null')
-                            if is_in_button:
-                                continue
-                        except:
-                            pass
-                        if tag_text not in found_tags:
-                            found_tags.append(tag_text)
-                            logger.info(f"Found tag via selector {selector}: {tag_text}")
-                            print(f"[TAG] Found tag via fallback selector: {tag_text}")
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
-        
-        # Strategy 4: Direct search for each dropdown option in izj773vLNpCIfNBWnzoQ containers
-        # This is a more direct approach - search for spans containing tag text that matches dropdown options
-        try:
-            for tag_option in TAG_OPTIONS:
-                # Skip if we already found this tag
-                tag_option_lower = tag_option.lower().strip()
-                already_found = any(found.lower().strip() == tag_option_lower for found in found_tags)
-                if already_found:
-                    continue
-                
-                # Search for this tag option in spans within izj773vLNpCIfNBWnzoQ containers
-                tag_found = await entry_elem.evaluate("""
-                    (tagOption) => {
-                        const containers = this.querySelectorAll('div[class*="izj773vLNpCIfNBWnzoQ"]');
-                        for (const container of containers) {
-                            // Get all child divs, skip first one
-                            const childDivs = Array.from(container.children).filter(el => el.tagName === 'DIV');
-                            for (let i = 1; i < childDivs.length; i++) {
-                                const childDiv = childDivs[i];
-                                // Skip empty or "Стаття" divs
-                                const divText = childDiv.textContent.trim();
-                                if (!divText || (divText.includes('Стаття') && divText.length < 20)) continue;
-                                
-                                // Find spans in this div
-                                const spans = childDiv.querySelectorAll('span');
-                                for (const span of spans) {
-                                    const text = span.textContent.trim();
-                                    // Skip if it's in a button
-                                    if (span.closest('button')) continue;
-                                    // Skip empty, single chars, "Стаття"
-                                    if (!text || text === 'x' || text === 'X' || text === 'Стаття' || text.length < 2) continue;
-                                    
-                                    // Check if this span text matches or contains the tag option
-                                    const textLower = text.toLowerCase();
-                                    const tagLower = tagOption.toLowerCase();
-                                    // Exact match or tag option is contained in text (e.g., "Терсад" in "Терсад ВДНГ")
-                                    // or text is contained in tag option
-                                    if (textLower === tagLower || textLower.includes(tagLower) || tagLower.includes(textLower)) {
-                                        return text; // Return the actual text found
-                                    }
-                                }
-                            }
-                        }
-                        return null;
-                    }
-                """, tag_option)
-                
-                if tag_found and tag_found not in found_tags:
-                    found_tags.append(tag_found)
-                    logger.info(f"Found tag '{tag_found}' matching dropdown option '{tag_option}' (Strategy 4)")
-                    print(f"[TAG] Found tag '{tag_found}' matching dropdown option '{tag_option}' (Strategy 4)")
         except Exception as e:
-            logger.debug(f"Strategy 4 (direct tag search) failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug(f"JavaScript tag extraction failed: {e}", exc_info=True)
         
         # Now match found tags against dropdown options with improved logic
         for found_tag in found_tags:
             found_tag_lower = found_tag.lower().strip()
-            best_match = None
-            best_match_score = 0
-            
-            # Try to find the best match
-            for tag_option in TAG_OPTIONS:
-                tag_option_lower = tag_option.lower().strip()
-                
-                # Score 3: Exact match (case-insensitive)
-                if tag_option_lower == found_tag_lower:
-                    best_match = tag_option
-                    best_match_score = 3
-                    break
-                
-                # Score 2: Found tag starts with dropdown option (e.g., "Терсад ВДНГ" starts with "Терсад")
-                if found_tag_lower.startswith(tag_option_lower + ' ') or found_tag_lower.startswith(tag_option_lower):
-                    if best_match_score < 2:
-                        best_match = tag_option
-                        best_match_score = 2
-                
-                # Score 1: Dropdown option is contained in found tag (e.g., "ББ маршрути" in "ББ Маршрути")
-                elif tag_option_lower in found_tag_lower:
-                    if best_match_score < 1:
-                        best_match = tag_option
-                        best_match_score = 1
-                
-                # Score 0.5: Found tag is contained in dropdown option
-                elif found_tag_lower in tag_option_lower:
-                    if best_match_score < 0.5:
-                        best_match = tag_option
-                        best_match_score = 0.5
+            # Score 3 (exact match, case-insensitive) is a single dict lookup
+            best_match = _TAG_OPTIONS_BY_LOWER.get(found_tag_lower)
+            best_match_score = 3 if best_match else 0
+            
+            # Otherwise score the partial matches. Lengths decide which checks can succeed:
+            # an option can only prefix or be contained in a tag at least as long as itself,
+            # and the tag can only be contained in a longer option
+            if not best_match:
+                found_tag_len = len(found_tag_lower)
+                for tag_option, tag_option_lower, tag_option_len in _TAG_OPTIONS_LOWER:
+                    if tag_option_len <= found_tag_len:
+                        # Score 2: Found tag starts with dropdown option (e.g., "Терсад ВДНГ" starts with "Терсад")
+                        if found_tag_lower.startswith(tag_option_lower):
+                            if best_match_score < 2:
+                                best_match = tag_option
+                                best_match_score = 2
+                        
+                        # Score 1: Dropdown option is contained in found tag (e.g., "ББ маршрути" in "ББ Маршрути")
+                        elif tag_option_lower in found_tag_lower:
+                            if best_match_score < 1:
+                                best_match = tag_option
+                                best_match_score = 1
+                    
+                    # Score 0.5: Found tag is contained in dropdown option
+                    elif found_tag_lower in tag_option_lower:
+                        if best_match_score < 0.5:
+                            best_match = tag_option
+                            best_match_score = 0.5
             
-            if best_match and best_match not in matched_tags:
+            if best_match and best_match not in matched_seen:
                 # Use matched dropdown option (same behavior as social network dropdown)
+                matched_seen.add(best_match)
                 matched_tags.append(best_match)
                 logger.debug(f"Matched '{found_tag}' -> '{best_match}' (score: {best_match_score})")
             elif not best_match:
                 # No match found - use original tag text (will be inserted as-is, user can change via dropdown)
                 # Same behavior as social network: if no match, still write the value so user can change it later
-                if found_tag not in matched_tags:
+                if found_tag not in matched_seen:
+                    matched_seen.add(found_tag)
                     matched_tags.append(found_tag)
                     logger.debug(f"No match for '{found_tag}', using original (user can change via dropdown)")
         
         # Log final results
         if matched_tags:
             logger.info(f"Final matched tags: {matched_tags}")
-            print(f"[TAG] Final matched tags: {matched_tags}")
         elif found_tags:
             logger.warning(f"Found tags but no matches: {found_tags}")
-            print(f"[TAG] Found tags but no matches: {found_tags}")
         else:
             logger.warning("No tags found for this entry")
-            print(f"[TAG] No tags found for this entry")
         
         # Return all matched tags (not just first one)
         # Note: We take the first tag when assigning to entry.tag, and return all for flexibility
         return matched_tags
     
-    async def _parse_note_async(self, entry_elem) -> str:
-        """Parse note (Примітки) - extract text after username from div.e99EkRyEQ2YU1HjaKz7j (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        note_parts = []
+    def _build_note(self, action_text: Optional[str], fallback_parts: List[str]) -> str:
+        """Build the note (Примітки) from the texts read by ENTRY_FIELDS_JS.
         
+        Primary source is the text after the username in div.e99EkRyEQ2YU1HjaKz7j;
+        otherwise the fallback parts (main paragraph / text spans / content container) are joined.
+        """
         # Primary method: Extract text after username from div.e99EkRyEQ2YU1HjaKz7j
         # Example: <div class="e99EkRyEQ2YU1HjaKz7j">Невідомий користувач<span> </span>відповів(ла) на коментар<span> </span><span>в<span> </span>...
         # We want: "відповів(ла) на коментар в AXIOMA design"
-        try:
-            user_action_div = await entry_elem.query_selector('div.e99EkRyEQ2YU1HjaKz7j, div[class*="e99EkRyEQ2YU1HjaKz7j"]')
-            if user_action_div:
-                # Get the full HTML content
-                html_content = await user_action_div.inner_html()
-                
-                # Parse all text nodes and span contents, skipping the first text (username)
-                # Get inner text which will combine all text with spaces
-                full_text = (await user_action_div.inner_text()).strip()
-                
-                # Split by whitespace to separate parts
-                parts = full_text.split()
+        if action_text:
+            # Split off only the first two words; the rest stays one string
+            # (whitespace is collapsed below)
+            parts = action_text.strip().split(None, 2)
+            
+            # Try to identify username (usually first part or "Невідомий користувач")
+            # Skip username and collect the rest
+            if parts:
+                # Check if first part looks like username (starts with capital or is "Невідомий")
+                if parts[0] == "Невідомий" and len(parts) > 1 and parts[1] == "користувач":
+                    # Skip "Невідомий користувач"
+                    note_text = parts[2] if len(parts) > 2 else ''
+                else:
+                    # Skip first part (username)
+                    note_text = ' '.join(parts[1:])
                 
-                # Try to identify username (usually first part or "Невідомий користувач")
-                # Skip username and collect the rest
-                if parts:
-                    # Check if first part looks like username (starts with capital or is "Невідомий")
-                    if parts[0] == "Невідомий" and len(parts) > 1 and parts[1] == "користувач":
-                        # Skip "Невідомий користувач"
-                        note_text = ' '.join(parts[2:])
-                    else:
-                        # Skip first part (username)
-                        note_text = ' '.join(parts[1:])
+                if note_text:
+                    # Clean up engagement numbers like "1 тис." and remove redundant spaces
+                    # (str.split/join collapses and strips whitespace in C, no second regex pass)
+                    note_text = ' '.join(_ENGAGEMENT_RE.sub('', note_text).split())
                     
                     if note_text:
-                        # Clean up engagement numbers like "1 тис."
-                        note_text = re.sub(r'\d+\s*тис\.', '', note_text).strip()
-                        # Remove redundant spaces
-                        note_text = re.sub(r'\s+', ' ', note_text).strip()
-                        
-                        if note_text:
-                            return note_text
-        except Exception as e:
-            logger.debug(f"Error extracting note from div.e99EkRyEQ2YU1HjaKz7j: {e}")
-        
-        # Fallback 1: Try to find the main text paragraph
-        try:
-            # Main text: <p class="VqFKkdgOknQMdibReX6Y">
-            main_text_elem = await entry_elem.query_selector('p.VqFKkdgOknQMdibReX6Y, p[class*="VqFKkdgOknQMdibReX6Y"]')
-            if main_text_elem:
-                main_text = (await main_text_elem.inner_text()).strip()
-                if main_text:
-                    note_parts.append(main_text)
-        except:
-            pass
-        
-        # Fallback 2: Try to find additional text spans
-        try:
-            # Additional text: <span class="Q73iQ9Oh3QBkbjh10U6t WJIiADpYvnCJ14uuC16a">
-            text_spans = await entry_elem.query_selector_all('span.Q73iQ9Oh3QBkbjh10U6t, span[class*="Q73iQ9Oh3QBkbjh10U6t"]')
-            for span in text_spans:
-                try:
-                    span_text = (await span.inner_text()).strip()
-                    # Filter out UI elements and very short text
-                    if span_text and len(span_text) > 10 and 'Перекласти' not in span_text and 'Додати тег' not in span_text:
-                        # Avoid duplicates
-                        if span_text not in note_parts:
-                            note_parts.append(span_text)
-                except:
-                    continue
-        except:
-            pass
+                        return note_text
         
-        # Fallback 3: Look for main content area if specific classes not found
-        if not note_parts:
-            content_selectors = [
-                'div[class*="yOPHd5XCBg3vO0C9GJNN"]',  # Content wrapper class
-                'div[class*="GcnHzy56qFW5AbYII5ig"]',  # Text container class
-                '[class*="content"]',
-                '[class*="text"]',
-                'p',
-            ]
-            
-            for selector in content_selectors:
-                try:
-                    content_elem = await entry_elem.query_selector(selector)
-                    if content_elem:
-                        text = (await content_elem.inner_text()).strip()
-                        # Filter out UI elements
-                        if text and len(text) > 20 and 'Додати тег' not in text and 'Перекласти' not in text:
-                            note_parts.append(text)
-                            break
-                except:
-                    continue
-        
-        # Combine all parts
-        note_text = ' '.join(note_parts).strip()
+        # Fallbacks: combine all parts
+        note_text = ' '.join(fallback_parts).strip()
         
-        # Clean up note text
+        # Clean up note text: trailing "Перекласти" button text and engagement numbers
         if note_text:
-            # Remove "Перекласти" button text
-            note_text = re.sub(r'Перекласти\s*$', '', note_text).strip()
-            # Remove engagement numbers
-            note_text = re.sub(r'\d+\s*тис\.', '', note_text).strip()
+            note_text = _NOTE_CLEAN_RE.sub('', note_text).strip()
         
         return note_text
     
-    async def _parse_user_description_async(self, entry_elem, name_elem) -> str:
-        """Parse user description by clicking on username (async version)."""
-        import logging
-        logger = logging.getLogger(__name__)
+    @asynccontextmanager
+    async def _opened_modal(self):
+        """Close the open modal with Escape on exit and wait for it to disappear."""
+        try:
+            yield
+        finally:
+            try:
+                await self.page.keyboard.press('Escape')
+                # Wait for the modal to go away before the next entry clicks its username
+                await self.page.wait_for_selector('[role="dialog"]', state='hidden', timeout=2000)
+            except _PLAYWRIGHT_ERRORS:
+                pass
+    
+    async def _parse_user_description_async(self, entry_elem, name_elem) -> Optional[str]:
+        """Parse user description by clicking on username (async version).
         
+        Returns None when the modal could not be opened or read, so the caller doesn't cache it.
+        """
         try:
             # If no name element provided, try to find it
+            # (same NAME_SELECTORS precedence as ENTRY_FIELDS_JS, resolved in one round-trip)
             if not name_elem:
-                name_selectors = [
-                    'span.NR97fosTp2Dtw_WKVPAN',
-                    'span[class*="NR97fosTp2Dtw"]',
-                    'div[class*="e99EkRyEQ2YU1HjaKz7j"] span',
-                ]
-                for selector in name_selectors:
-                    try:
-                        name_elem = await entry_elem.query_selector(selector)
-                        if name_elem:
-                            name_text = (await name_elem.inner_text()).strip()
-                            if name_text and len(name_text) > 2:
-                                break
-                    except:
-                        continue
+                try:
+                    name_handle = await entry_elem.evaluate_handle("""
+                        (el, selectors) => {
+                            let nameElem = null;
+                            for (const selector of selectors) {
+                                const candidate = el.querySelector(selector);
+                                if (candidate) {
+                                    nameElem = candidate;
+                                    const nameText = candidate.innerText.trim();
+                                    if (nameText && nameText.length > 2) break;
+                                }
+                            }
+                            return nameElem;
+                        }
+                    """, list(self.NAME_SELECTORS))
+                    name_elem = name_handle.as_element()
+                    if not name_elem:
+                        await name_handle.dispose()
+                except _PLAYWRIGHT_ERRORS:
+                    pass
             
             if not name_elem:
                 logger.debug("No username element found for description parsing")
-                return ''
+                return None
             
             # The username span might be inside a clickable parent div with aria-expanded="false"
             # Use JavaScript to find and click the clickable parent element
@@ -1947,19 +1735,15 @@ class YouScanParser:
                 
                 if clicked:
                     logger.debug("Clicked on username element (or parent)")
-                    print(f"[DESC] Clicked on username element")
                 else:
                     logger.debug("Could not click username element")
-                    return ''
+                    return None
             except Exception as click_error:
                 logger.debug(f"Error clicking username: {click_error}")
-                return ''
+                return None
             
             if clicked:
-                # Wait for modal to appear
-                await asyncio.sleep(1.5)  # Give time for modal to load
-                
-                # Look for modal/popup with role="dialog"
+                # Look for modal/popup with role="dialog" (waits only as long as it takes to appear)
                 # The description is in a div with class like "jrnY5tmnFg128QMOKSyq"
                 modal = None
                 try:
@@ -1968,94 +1752,64 @@ class YouScanParser:
                         timeout=3000,
                         state='visible'
                     )
-                except:
+                except _PLAYWRIGHT_ERRORS:
                     # Modal might not appear, try to find it anyway
                     try:
                         modal = await self.page.query_selector('[role="dialog"]')
-                    except:
+                    except _PLAYWRIGHT_ERRORS:
                         pass
                 
                 if modal:
-                    logger.debug("Modal found, searching for description")
-                    print(f"[DESC] Modal found, searching for description")
-                    
-                    # Try multiple strategies to find the description div
-                    description_selectors = [
-                        'div[class*="jrnY5tmnFg128QMOKSyq"]',  # Specific class from example
-                        'div[class*="jrnY5tmn"]',  # Partial match
-                        'div[class*="QMOKSyq"]',  # Another partial match
-                        '[class*="description"]',
-                        '[class*="bio"]',
-                        '[class*="about"]',
-                    ]
+                    # Escape closes the modal on exit, without probing the page for a close button
+                    async with self._opened_modal():
+                        logger.debug("Modal found, searching for description")
                     
-                    desc_text = ''
-                    for selector in description_selectors:
+                        # Try multiple strategies to find the description div. All probes run in one
+                        # evaluate, so a missing selector is a null check in the page rather than a
+                        # round-trip (and possibly an exception) per selector or per div
                         try:
-                            desc_elem = await modal.query_selector(selector)
-                            if desc_elem:
-                                desc_text = (await desc_elem.inner_text()).strip()
-                                if desc_text and len(desc_text) > 10:  # Must have substantial content
-                                    logger.info(f"Found description using selector: {selector}")
-                                    print(f"[DESC] Found description: {desc_text[:100]}...")
-                                    break
-                        except:
-                            continue
-                    
-                    # If not found with specific selectors, try to find any div with substantial text
-                    if not desc_text:
-                        try:
-                            # Look for divs with multiple spans (like the example structure)
-                            all_divs = await modal.query_selector_all('div')
-                            for div in all_divs:
-                                div_text = (await div.inner_text()).strip()
-                                # Check if it looks like a description (has URLs, multiple lines, etc.)
-                                if div_text and len(div_text) > 20 and ('http' in div_text or '▫️' in div_text or '\n' in div_text):
-                                    desc_text = div_text
-                                    logger.info("Found description in div with substantial content")
-                                    print(f"[DESC] Found description: {desc_text[:100]}...")
-                                    break
-                        except:
-                            pass
-                    
-                    # Close modal
-                    try:
-                        # Try multiple close button selectors
-                        close_selectors = [
-                            'button[aria-label="Close"]',
-                            'button:has-text("×")',
-                            'button[class*="close"]',
-                            '[aria-label*="close" i]',
-                            'button:has([class*="close"])',
-                        ]
-                        for close_selector in close_selectors:
-                            try:
-                                close_btn = await self.page.query_selector(close_selector)
-                                if close_btn:
-                                    await close_btn.click()
-                                    await asyncio.sleep(0.5)
-                                    logger.debug("Closed modal")
-                                    break
-                            except:
-                                continue
+                            found = await modal.evaluate("""
+                                (modal, selectors) => {
+                                    let descText = '';
+                                    for (const selector of selectors) {
+                                        const descElem = modal.querySelector(selector);
+                                        if (descElem) {
+                                            descText = descElem.innerText.trim();
+                                            if (descText && descText.length > 10) {  // Must have substantial content
+                                                return {text: descText, selector: selector};
+                                            }
+                                        }
+                                    }
+                                    
+                                    // If not found with specific selectors, try to find any div with substantial text
+                                    // (divs with multiple spans, like the example structure)
+                                    if (!descText) {
+                                        for (const div of modal.querySelectorAll('div')) {
+                                            const divText = div.innerText.trim();
+                                            // Check if it looks like a description (has URLs, multiple lines, etc.)
+                                            if (divText && divText.length > 20 && (divText.includes('http') || divText.includes('▫️') || divText.includes('\\n'))) {
+                                                return {text: divText, selector: 'div'};
+                                            }
+                                        }
+                                    }
+                                    return {text: descText, selector: null};
+                                }
+                            """, list(self.DESCRIPTION_SELECTORS))
+                        except _PLAYWRIGHT_ERRORS as e:
+                            logger.debug(f"Could not read the description from the modal: {e}")
+                            return None
                         
-                        # Fallback: Press Escape key
-                        await self.page.keyboard.press('Escape')
-                        await asyncio.sleep(0.5)
-                    except:
-                        pass
+                        desc_text = found['text']
+                        if found['selector']:
+                            logger.info(f"Found description using selector: {found['selector']}")
                     
-                    return desc_text
+                        return desc_text
                 else:
                     logger.debug("No modal found after clicking username")
-                    print(f"[DESC] No modal found after clicking username")
                 
         except Exception as e:
-            logger.warning(f"Error parsing user description: {e}")
-            print(f"[DESC] Error parsing user description: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning(f"Error parsing user description: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         
-        return ''
+        return None
     
 